@@ -0,0 +1,11 @@
+# コマンドラインと各モジュールで共有する既定値
+# （サブコマンドの依存パッケージを読み込まずに参照できるよう独立させている）
+
+# ローカル計算サーバーの待ち受けアドレスとポート
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# フォルダ監視のポーリング間隔[s]、同時処理数、キューの上限
+DEFAULT_INTERVAL = 5.0
+DEFAULT_CONCURRENCY = 4
+DEFAULT_QUEUE_SIZE = 16
@@ -0,0 +1,17 @@
+from .layout import (
+    Annotation,
+    Box,
+    PlacedAnnotation,
+    Placement,
+    UniformGrid,
+    layout_annotations,
+)
+
+__all__ = [
+    "Annotation",
+    "Box",
+    "PlacedAnnotation",
+    "Placement",
+    "UniformGrid",
+    "layout_annotations",
+]
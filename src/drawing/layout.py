@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+# 注記同士・注記と図形の間に確保する既定の隙間[mm]
+DEFAULT_GAP = 1.0
+# 1つの注記について試行する段数の既定値
+DEFAULT_MAX_TIERS = 20
+
+
+class Placement(Enum):
+    """注記を基準点に対してどちら側に配置するかを表す。"""
+
+    ABOVE = "above"
+    BELOW = "below"
+
+
+@dataclass(frozen=True)
+class Box:
+    """軸に平行な矩形領域。
+
+    Attributes:
+        x_min (float): 左端のx座標[mm]。
+        y_min (float): 下端のy座標[mm]。
+        x_max (float): 右端のx座標[mm]。
+        y_max (float): 上端のy座標[mm]。
+    """
+
+    x_min: float
+    y_min: float
+    x_max: float
+    y_max: float
+
+    def __post_init__(self) -> None:
+        if self.x_min > self.x_max or self.y_min > self.y_max:
+            raise ValueError("矩形の最小座標が最大座標を超えています。")
+
+    def intersects(self, other: Box, gap: float = 0.0) -> bool:
+        """隙間 `gap` を考慮して他の矩形と重なるかを判定する。
+
+        Args:
+            other (Box): 判定対象の矩形。
+            gap (float): 確保する隙間[mm]。
+
+        Returns:
+            bool: 重なる（隙間が不足する）場合にTrue。
+        """
+
+        return (
+            self.x_min < other.x_max + gap
+            and other.x_min < self.x_max + gap
+            and self.y_min < other.y_max + gap
+            and other.y_min < self.y_max + gap
+        )
+
+
+@dataclass
+class Annotation:
+    """配置する注記（寸法値・エレメント名・公差枠など）。
+
+    Attributes:
+        name (str): 注記の識別名。
+        anchor_x (float): 基準点のx座標[mm]。注記は基準点を水平方向の中心とする。
+        anchor_y (float): 基準点のy座標[mm]。
+        width (float): 注記の幅[mm]。
+        height (float): 注記の高さ[mm]。
+        placement (Placement): 基準点に対する配置側。
+        priority (int): 配置の優先度。大きいほど先に配置し、基準点の近くに置かれる。
+    """
+
+    name: str
+    anchor_x: float
+    anchor_y: float
+    width: float
+    height: float
+    placement: Placement = Placement.ABOVE
+    priority: int = 0
+
+    def __post_init__(self) -> None:
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError("注記の幅と高さは正である必要があります。")
+
+    def box_at_tier(self, tier: int, gap: float) -> Box:
+        """基準点から `tier` 段離した位置の矩形を返す。
+
+        Args:
+            tier (int): 段数。0は基準点に最も近い位置。
+            gap (float): 基準点・段の間の隙間[mm]。
+
+        Returns:
+            Box: 注記の矩形。
+        """
+
+        offset = gap + tier * (self.height + gap)
+        x_min = self.anchor_x - self.width / 2.0
+        if self.placement is Placement.ABOVE:
+            y_min = self.anchor_y + offset
+        else:
+            y_min = self.anchor_y - offset - self.height
+        return Box(x_min, y_min, x_min + self.width, y_min + self.height)
+
+
+@dataclass
+class PlacedAnnotation:
+    """配置結果。
+
+    Attributes:
+        name (str): 注記の識別名。
+        box (Box): 配置した矩形。
+        tier (int): 基準点から離した段数。
+        overlapped (bool): 最大段数まで試しても重なりを解消できなかった場合にTrue。
+    """
+
+    name: str
+    box: Box
+    tier: int
+    overlapped: bool = False
+
+
+@dataclass
+class UniformGrid:
+    """矩形を一様格子に登録し、近傍の矩形を高速に検索する空間インデックス。
+
+    矩形は重なるすべてのセルに登録します。セル寸法を注記の代表寸法程度に
+    とると、1回の検索で調べる矩形数は全体の件数によらずほぼ一定になります。
+
+    Attributes:
+        cell_size (float): セルの一辺[mm]。
+    """
+
+    cell_size: float
+    _cells: dict[tuple[int, int], list[Box]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.cell_size <= 0:
+            raise ValueError("cell_sizeは正である必要があります。")
+
+    def _cell_range(self, box: Box, gap: float) -> Iterator[tuple[int, int]]:
+        i_min = math.floor((box.x_min - gap) / self.cell_size)
+        i_max = math.floor((box.x_max + gap) / self.cell_size)
+        j_min = math.floor((box.y_min - gap) / self.cell_size)
+        j_max = math.floor((box.y_max + gap) / self.cell_size)
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                yield i, j
+
+    def insert(self, box: Box) -> None:
+        """矩形を登録する。
+
+        Args:
+            box (Box): 登録する矩形。
+        """
+
+        for cell in self._cell_range(box, 0.0):
+            self._cells.setdefault(cell, []).append(box)
+
+    def collides(self, box: Box, gap: float = 0.0) -> bool:
+        """登録済みの矩形と重なるかを判定する。
+
+        Args:
+            box (Box): 判定する矩形。
+            gap (float): 確保する隙間[mm]。
+
+        Returns:
+            bool: いずれかの登録済み矩形と重なる場合にTrue。
+        """
+
+        for cell in self._cell_range(box, gap):
+            for other in self._cells.get(cell, ()):
+                if box.intersects(other, gap):
+                    return True
+        return False
+
+
+def _default_cell_size(annotations: Sequence[Annotation], gap: float) -> float:
+    sizes = sorted(max(a.width, a.height) for a in annotations)
+    return sizes[len(sizes) // 2] + gap
+
+
+def layout_annotations(
+    annotations: Sequence[Annotation],
+    obstacles: Iterable[Box] = (),
+    gap: float = DEFAULT_GAP,
+    max_tiers: int = DEFAULT_MAX_TIERS,
+    cell_size: float | None = None,
+) -> list[PlacedAnnotation]:
+    """注記が互いに・図形と重ならないように配置座標を決定する。
+
+    優先度の高い順、同じ優先度では基準点のx座標順に注記を並べ、
+    基準点に最も近い段から順に空いている位置を探します。配置済みの矩形は
+    一様格子の空間インデックスに登録するため、重なり判定は近傍のみを対象とし、
+    全体の計算量は整列の O(n log n) が支配的になります。
+
+    Args:
+        annotations (Sequence[Annotation]): 配置する注記。
+        obstacles (Iterable[Box]): 注記と重ねてはならない図形（レンズ外形など）の矩形。
+        gap (float): 注記と他の矩形の間に確保する隙間[mm]。
+        max_tiers (int): 1つの注記について試行する段数。
+        cell_size (float | None): 空間インデックスのセル寸法[mm]。
+            省略時は注記寸法の中央値から決める。
+
+    Returns:
+        list[PlacedAnnotation]: 入力と同じ順序の配置結果。
+    """
+
+    if max_tiers < 1:
+        raise ValueError("max_tiersは1以上である必要があります。")
+    if not annotations:
+        return []
+    if cell_size is None:
+        cell_size = _default_cell_size(annotations, gap)
+
+    grid = UniformGrid(cell_size)
+    for obstacle in obstacles:
+        grid.insert(obstacle)
+
+    order = sorted(
+        range(len(annotations)),
+        key=lambda i: (-annotations[i].priority, annotations[i].anchor_x),
+    )
+    placed: list[PlacedAnnotation | None] = [None] * len(annotations)
+    for index in order:
+        annotation = annotations[index]
+        result = None
+        for tier in range(max_tiers):
+            box = annotation.box_at_tier(tier, gap)
+            if not grid.collides(box, gap):
+                result = PlacedAnnotation(annotation.name, box, tier)
+                break
+        if result is None:
+            # 空きが見つからない場合は最も外側の段に置き、重なりとして報告する
+            tier = max_tiers - 1
+            result = PlacedAnnotation(
+                annotation.name, annotation.box_at_tier(tier, gap), tier, True
+            )
+        grid.insert(result.box)
+        placed[index] = result
+    return [p for p in placed if p is not None]
@@ -1,5 +1,141 @@
-def main():
-    print("Hello from rapid-automation!")
+"""rapid-automationのコマンドラインツール。
+
+リポジトリのルートで `python -m src.main <サブコマンド>` として実行します。
+各サブコマンドの依存モジュールは実行時に読み込むため、使用しない機能の
+依存パッケージ（pandas、pyarrowなど）は起動時に読み込まれません。
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from src.defaults import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_HOST,
+    DEFAULT_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_QUEUE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを構築する。
+
+    Returns:
+        argparse.ArgumentParser: サブコマンドを登録したパーサー。
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m src.main")
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve = subparsers.add_parser("serve", help="ローカル計算サーバーを起動する")
+    serve.add_argument(
+        "--host", default=DEFAULT_HOST, help="待ち受けアドレス（既定: %(default)s）"
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="待ち受けポート（既定: %(default)s）",
+    )
+
+    watch = subparsers.add_parser(
+        "watch", help="設計ファイルのフォルダを監視し、変更分のみ処理する"
+    )
+    watch.add_argument("source", type=Path, help="監視するディレクトリ")
+    watch.add_argument("output", type=Path, help="出力先ディレクトリ")
+    watch.add_argument(
+        "--state",
+        type=Path,
+        default=None,
+        help="状態ファイルのパス（既定: <出力先>/.watch-state.json）",
+    )
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help="ポーリング間隔[s]（既定: %(default)s）",
+    )
+    watch.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="同時処理数（既定: %(default)s）",
+    )
+    watch.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="キューの上限（既定: %(default)s）",
+    )
+    watch.add_argument("--once", action="store_true", help="1回だけ走査して終了する")
+    return parser
+
+
+async def run_watch(args: argparse.Namespace) -> None:
+    """watchサブコマンドを実行する。
+
+    Args:
+        args (argparse.Namespace): 解析済みのコマンドライン引数。
+    """
+
+    from src.pipeline.watch import WatchPipeline, WatchState, default_exporter
+
+    state_path = args.state or args.output / ".watch-state.json"
+    pipeline = WatchPipeline(
+        source_dir=args.source,
+        state=WatchState.load(state_path),
+        exporter=default_exporter(args.output),
+        concurrency=args.concurrency,
+        queue_size=args.queue_size,
+    )
+    if args.once:
+        await pipeline.run_once()
+        pipeline.log_metrics()
+    else:
+        await pipeline.run_forever(args.interval)
+
+
+async def run_serve(args: argparse.Namespace) -> None:
+    """serveサブコマンドを実行する。
+
+    Args:
+        args (argparse.Namespace): 解析済みのコマンドライン引数。
+    """
+
+    from src.optics.server import serve_forever
+
+    await serve_forever(args.host, args.port)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """コマンドラインのエントリーポイント。
+
+    Args:
+        argv (list[str] | None): コマンドライン引数。省略時はsys.argvを使用する。
+    """
+
+    logging.basicConfig(level=logging.INFO)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(run_serve(args))
+        except KeyboardInterrupt:
+            logger.info("計算サーバーを停止しました。")
+    elif args.command == "watch":
+        try:
+            asyncio.run(run_watch(args))
+        except ImportError as error:
+            parser.exit(1, f"{error}\n")
+        except KeyboardInterrupt:
+            logger.info("フォルダ監視を停止しました。")
+    else:
+        parser.print_help()
 
 
 if __name__ == "__main__":
@@ -1,3 +1,45 @@
-from .calculations import AsphericCoefficients, calculate_sag
+from .calculations import AsphericCoefficients, LensElement, calculate_sag
+from .cemented import (
+    CementedLens,
+    CementedLensResult,
+    CementedLimits,
+    CementedSurface,
+    InterfaceCheck,
+    calculate_cemented_lens,
+    calculate_cemented_lenses,
+)
+from .dispersion import (
+    SchottCoefficients,
+    SellmeierCoefficients,
+    calculate_chromatic_focal_lengths,
+    calculate_longitudinal_chromatic_shift,
+    calculate_refractive_indices,
+)
+from .mass_properties import (
+    MassProperties,
+    calculate_assembly_mass_properties,
+    calculate_mass_properties,
+    calculate_mass_properties_batch,
+)
 
-__all__ = ["AsphericCoefficients", "calculate_sag"]
+__all__ = [
+    "AsphericCoefficients",
+    "CementedLens",
+    "CementedLensResult",
+    "CementedLimits",
+    "CementedSurface",
+    "InterfaceCheck",
+    "LensElement",
+    "MassProperties",
+    "SchottCoefficients",
+    "SellmeierCoefficients",
+    "calculate_assembly_mass_properties",
+    "calculate_cemented_lens",
+    "calculate_cemented_lenses",
+    "calculate_chromatic_focal_lengths",
+    "calculate_longitudinal_chromatic_shift",
+    "calculate_mass_properties",
+    "calculate_mass_properties_batch",
+    "calculate_refractive_indices",
+    "calculate_sag",
+]
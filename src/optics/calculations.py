@@ -29,6 +29,43 @@ class AsphericCoefficients:
     a14: float = 0.0
 
 
+@dataclass
+class LensElement:
+    """単レンズ（エレメント）の形状と硝材情報を保持するデータクラス。
+
+    `calculate_glass_weight()` の引数一式をまとめたもので、
+    複数エレメントを一括で扱う計算の入力として使用する。
+
+    Attributes:
+        radius1 (float | None): R1面の曲率半径[mm]。Noneまたは0の場合は平面。
+        radius2 (float | None): R2面の曲率半径[mm]。Noneまたは0の場合は平面。
+        thickness (float): 中心厚[mm]。
+        specific_gravity (float): 硝材の比重[g/cm^3]。
+        diameter1 (float): R1面の有効径[mm]。
+        diameter2 (float): R2面の有効径[mm]。
+        max_diameter (float): 最大外径[mm]。
+        coefficients1 (AsphericCoefficients | None): R1面の非球面係数。
+        coefficients2 (AsphericCoefficients | None): R2面の非球面係数。
+    """
+
+    radius1: float | None
+    radius2: float | None
+    thickness: float
+    specific_gravity: float
+    diameter1: float
+    diameter2: float
+    max_diameter: float
+    coefficients1: AsphericCoefficients | None = None
+    coefficients2: AsphericCoefficients | None = None
+
+    def __post_init__(self) -> None:
+        _validate_number(self.thickness, "thickness")
+        _validate_number(self.specific_gravity, "specific_gravity")
+        _validate_number(self.diameter1, "diameter1")
+        _validate_number(self.diameter2, "diameter2")
+        _validate_number(self.max_diameter, "max_diameter")
+
+
 def _validate_number(value: object, name: str) -> None:
     if not isinstance(value, (int, float)) or isinstance(value, bool):
         raise TypeError(f"{name}は数値である必要があります。")
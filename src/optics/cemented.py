@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .calculations import AsphericCoefficients, LensElement, _validate_number
+from .mass_properties import MM3_PER_CM3, _disc_integrals, _sample_surfaces
+
+# 接合レンズを構成する最小エレメント数
+MIN_CEMENTED_ELEMENTS = 2
+# 許容する接着層の厚み差（接合面の隙間）の既定値[mm]
+DEFAULT_MAX_CEMENT_GAP = 0.01
+
+VIOLATION_DIAMETER = "diameter"
+VIOLATION_CEMENT_GAP = "cement_gap"
+VIOLATION_EDGE_STEP = "edge_step"
+
+
+@dataclass
+class CementedSurface:
+    """接合レンズを構成する1面の形状を保持するデータクラス。
+
+    Attributes:
+        radius (float | None): 曲率半径[mm]。Noneまたは0の場合は平面。
+        diameter (float): 有効径[mm]。
+        coefficients (AsphericCoefficients | None): 非球面係数。省略時は球面。
+        mating (CementedSurface | None): 接合面で後側エレメントの面形状が
+            前側と異なる場合の後側の面。Noneの場合は前後で同一形状の共有面とする。
+    """
+
+    radius: float | None
+    diameter: float
+    coefficients: AsphericCoefficients | None = None
+    mating: CementedSurface | None = None
+
+    def __post_init__(self) -> None:
+        _validate_number(self.diameter, "diameter")
+
+
+@dataclass
+class CementedLens:
+    """接合レンズ（ダブレット・トリプレット等）の面構成を保持するデータクラス。
+
+    面は光軸に沿って並べ、隣り合うエレメントは接合面を共有する。
+    エレメント数をnとすると面数はn+1となる。
+
+    Attributes:
+        surfaces (list[CementedSurface]): 先頭面から順に並べた面（n+1面）。
+        thicknesses (list[float]): 各エレメントの中心厚[mm]（n個）。
+        specific_gravities (list[float]): 各エレメントの硝材比重[g/cm^3]（n個）。
+        max_diameters (list[float]): 各エレメントの最大外径[mm]（n個）。
+    """
+
+    surfaces: list[CementedSurface]
+    thicknesses: list[float]
+    specific_gravities: list[float]
+    max_diameters: list[float]
+
+    def __post_init__(self) -> None:
+        element_count = len(self.thicknesses)
+        if element_count < MIN_CEMENTED_ELEMENTS:
+            raise ValueError("接合レンズには2枚以上のエレメントが必要です。")
+        if len(self.surfaces) != element_count + 1:
+            raise ValueError("surfacesの要素数はエレメント数+1である必要があります。")
+        if len(self.specific_gravities) != element_count:
+            raise ValueError("specific_gravitiesの要素数がエレメント数と一致しません。")
+        if len(self.max_diameters) != element_count:
+            raise ValueError("max_diametersの要素数がエレメント数と一致しません。")
+        for value in self.thicknesses:
+            _validate_number(value, "thicknesses")
+        for value in self.specific_gravities:
+            _validate_number(value, "specific_gravities")
+        for value in self.max_diameters:
+            _validate_number(value, "max_diameters")
+
+    def to_elements(self) -> list[LensElement]:
+        """接合レンズを単レンズの並びに分解する。
+
+        Returns:
+            list[LensElement]: エレメントごとの単レンズ。接合面は後側エレメントに
+                mating の形状が指定されていればその形状、なければ前側と同一形状。
+        """
+
+        elements = []
+        for i in range(len(self.thicknesses)):
+            front = self.surfaces[i]
+            if i > 0 and front.mating is not None:
+                front = front.mating
+            rear = self.surfaces[i + 1]
+            elements.append(
+                LensElement(
+                    radius1=front.radius,
+                    radius2=rear.radius,
+                    thickness=self.thicknesses[i],
+                    specific_gravity=self.specific_gravities[i],
+                    diameter1=front.diameter,
+                    diameter2=rear.diameter,
+                    max_diameter=self.max_diameters[i],
+                    coefficients1=front.coefficients,
+                    coefficients2=rear.coefficients,
+                )
+            )
+        return elements
+
+
+@dataclass
+class CementedLimits:
+    """接合面チェックの判定基準を保持するデータクラス。
+
+    Attributes:
+        max_cement_gap (float): 許容する接合面の隙間（接着層の厚みの最大差）[mm]。
+        max_edge_step (float | None): 許容する前後エレメントの外径段差（半径差の
+            絶対値）[mm]。Noneの場合は判定しない。
+    """
+
+    max_cement_gap: float = DEFAULT_MAX_CEMENT_GAP
+    max_edge_step: float | None = None
+
+
+@dataclass
+class InterfaceCheck:
+    """接合面のチェック結果を保持するデータクラス。
+
+    Attributes:
+        surface_index (int): 接合面の面番号（先頭面を0とする）。
+        diameter (float): 接合面の有効径[mm]。
+        front_max_diameter (float): 前側エレメントの最大外径[mm]。
+        rear_max_diameter (float): 後側エレメントの最大外径[mm]。
+        edge_step (float): 前後エレメントの外径段差（半径差）[mm]。前側が大きい場合に正。
+        cement_gap (float): 前後の面形状の差から求めた接合面の隙間[mm]。
+            有効径内のサグ差の最大値と最小値の差で、共有面の場合は0。
+        violations (list[str]): 判定基準を満たさなかった項目。
+    """
+
+    surface_index: int
+    diameter: float
+    front_max_diameter: float
+    rear_max_diameter: float
+    edge_step: float
+    cement_gap: float = 0.0
+    violations: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """有効径が前後の最大外径に収まり、隙間・段差が判定基準内の場合にTrue。"""
+
+        return not self.violations
+
+
+@dataclass
+class CementedLensResult:
+    """接合レンズの重量・コバ厚・接合面チェックの計算結果。
+
+    Attributes:
+        element_weights (list[float]): 各エレメントの重量[g]。
+        total_weight (float): 接合レンズ全体の重量[g]。
+        edge_thicknesses (list[float]): 各エレメントのコバ厚[mm]。
+            有効径端のサグ量から求めた外周部の光軸方向厚み。
+        interfaces (list[InterfaceCheck]): 各接合面のチェック結果。
+    """
+
+    element_weights: list[float]
+    total_weight: float
+    edge_thicknesses: list[float]
+    interfaces: list[InterfaceCheck]
+
+    @property
+    def is_valid(self) -> bool:
+        """コバ厚が正で、すべての接合面がチェックを満たす場合にTrueを返す。"""
+
+        return all(t > 0 for t in self.edge_thicknesses) and all(
+            check.is_valid for check in self.interfaces
+        )
+
+
+def _check_interface(
+    lens: CementedLens, index: int, cement_gap: float, limits: CementedLimits
+) -> InterfaceCheck:
+    diameter = float(lens.surfaces[index].diameter)
+    front_max = float(lens.max_diameters[index - 1])
+    rear_max = float(lens.max_diameters[index])
+    edge_step = (front_max - rear_max) / 2.0
+
+    violations = []
+    if diameter > min(front_max, rear_max):
+        violations.append(VIOLATION_DIAMETER)
+    if cement_gap > limits.max_cement_gap:
+        violations.append(VIOLATION_CEMENT_GAP)
+    if limits.max_edge_step is not None and abs(edge_step) > limits.max_edge_step:
+        violations.append(VIOLATION_EDGE_STEP)
+    return InterfaceCheck(
+        surface_index=index,
+        diameter=diameter,
+        front_max_diameter=front_max,
+        rear_max_diameter=rear_max,
+        edge_step=edge_step,
+        cement_gap=cement_gap,
+        violations=violations,
+    )
+
+
+def calculate_cemented_lenses(
+    lenses: Sequence[CementedLens],
+    limits: CementedLimits | None = None,
+) -> list[CementedLensResult | None]:
+    """複数の接合レンズの重量・コバ厚・接合面チェックを一括計算する。
+
+    系内の全接合群の全面をまとめて1回だけサグ評価し、共有面のサグ標本は
+    前後のエレメントで共有します。後側の面形状（mating）が指定された接合面は、
+    前後の形状を共通の有効径で比較して接合面の隙間を求めます。
+    各エレメントの重量は `calculate_glass_weight()` と同じ値になります。
+
+    Args:
+        lenses (Sequence[CementedLens]): 計算対象の接合レンズ。
+        limits (CementedLimits | None): 接合面の判定基準。省略時は既定値を使用する。
+
+    Returns:
+        list[CementedLensResult | None]: 接合レンズごとの計算結果。
+            いずれかの面でサグ計算に失敗した接合レンズはNoneとなる。
+    """
+
+    if limits is None:
+        limits = CementedLimits()
+
+    # 評価する面（形状・有効半径）を並べ、各エレメントの前後面と
+    # 隙間評価用の面の行番号を記録する
+    rows: list[tuple[CementedSurface, float]] = []
+
+    def add_row(surface: CementedSurface, effective_radius: float) -> int:
+        rows.append((surface, effective_radius))
+        return len(rows) - 1
+
+    layouts = []
+    for lens in lenses:
+        shared = [add_row(s, float(s.diameter) / 2.0) for s in lens.surfaces]
+        fronts = list(shared[:-1])
+        gap_rows: dict[int, tuple[int, int]] = {}
+        for i in range(1, len(lens.surfaces) - 1):
+            surface = lens.surfaces[i]
+            if surface.mating is None:
+                continue
+            fronts[i] = add_row(surface.mating, float(surface.mating.diameter) / 2.0)
+            common = min(float(surface.diameter), float(surface.mating.diameter)) / 2.0
+            gap_rows[i] = (add_row(surface, common), add_row(surface.mating, common))
+        layouts.append((fronts, shared[1:], gap_rows))
+    if not rows:
+        return []
+
+    heights, sag = _sample_surfaces(
+        [s.radius for s, _ in rows],
+        [s.coefficients for s, _ in rows],
+        np.array([r for _, r in rows]),
+    )
+
+    results: list[CementedLensResult | None] = []
+    for lens, (fronts, rears, gap_rows) in zip(lenses, layouts):
+        used = fronts + rears + [r for pair in gap_rows.values() for r in pair]
+        if np.isnan(sag[used]).any():
+            results.append(None)
+            continue
+
+        thickness = np.array([float(t) for t in lens.thicknesses])
+        specific_gravity = np.array([float(g) for g in lens.specific_gravities])
+        max_radii = np.array([float(d) / 2.0 for d in lens.max_diameters])
+
+        # 硝材はR1面(Z1 = sag1)とR2面(Z2 = t + sag2)に挟まれた領域
+        volume = _disc_integrals(
+            thickness[:, np.newaxis] + sag[rears], heights[rears], max_radii
+        ) - _disc_integrals(sag[fronts], heights[fronts], max_radii)
+        weights = specific_gravity * volume / MM3_PER_CM3
+        edge_thicknesses = thickness + sag[rears, -1] - sag[fronts, -1]
+
+        interfaces = []
+        for i in range(1, len(lens.surfaces) - 1):
+            cement_gap = 0.0
+            if i in gap_rows:
+                front_row, mating_row = gap_rows[i]
+                difference = sag[mating_row] - sag[front_row]
+                cement_gap = float(np.max(difference) - np.min(difference))
+            interfaces.append(_check_interface(lens, i, cement_gap, limits))
+
+        results.append(
+            CementedLensResult(
+                element_weights=[float(w) for w in weights],
+                total_weight=float(np.sum(weights)),
+                edge_thicknesses=[float(t) for t in edge_thicknesses],
+                interfaces=interfaces,
+            )
+        )
+    return results
+
+
+def calculate_cemented_lens(
+    lens: CementedLens, limits: CementedLimits | None = None
+) -> CementedLensResult | None:
+    """接合レンズ1組の重量・コバ厚・接合面チェックを計算する。
+
+    Args:
+        lens (CementedLens): 計算対象の接合レンズ。
+        limits (CementedLimits | None): 接合面の判定基準。省略時は既定値を使用する。
+
+    Returns:
+        CementedLensResult | None: 計算結果。サグ計算に失敗した場合はNoneを返す。
+    """
+
+    return calculate_cemented_lenses([lens], limits)[0]
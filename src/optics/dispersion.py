@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .calculations import PLANE_RADIUS, LensElement
+
+# 代表的な波長[nm]（フラウンホーファー線および He-Ne レーザー）
+WAVELENGTH_G = 435.8343
+WAVELENGTH_F = 486.1327
+WAVELENGTH_E = 546.0740
+WAVELENGTH_D = 587.5618
+WAVELENGTH_C = 656.2725
+WAVELENGTH_HE_NE = 632.8
+NM_PER_UM = 1000.0
+
+
+@dataclass
+class SellmeierCoefficients:
+    """Sellmeier分散式の係数を保持するデータクラス。
+
+    n² - 1 = Σ Bi·λ² / (λ² - Ci)（λ[µm]）で屈折率を表す。
+    係数はSchott等の硝材カタログの表記（C1～C3の単位はµm²）に従う。
+
+    Attributes:
+        b1 (float): B1係数。
+        b2 (float): B2係数。
+        b3 (float): B3係数。
+        c1 (float): C1係数[µm²]。
+        c2 (float): C2係数[µm²]。
+        c3 (float): C3係数[µm²]。
+    """
+
+    b1: float
+    b2: float
+    b3: float
+    c1: float
+    c2: float
+    c3: float
+
+
+@dataclass
+class SchottCoefficients:
+    """Schott分散式（旧カタログ形式）の係数を保持するデータクラス。
+
+    n² = A0 + A1·λ² + A2·λ⁻² + A3·λ⁻⁴ + A4·λ⁻⁶ + A5·λ⁻⁸（λ[µm]）で屈折率を表す。
+
+    Attributes:
+        a0 (float): A0係数。
+        a1 (float): A1係数。
+        a2 (float): A2係数。
+        a3 (float): A3係数。
+        a4 (float): A4係数。
+        a5 (float): A5係数。
+    """
+
+    a0: float
+    a1: float
+    a2: float
+    a3: float
+    a4: float
+    a5: float
+
+
+DispersionCoefficients = SellmeierCoefficients | SchottCoefficients
+
+
+def calculate_refractive_indices(
+    glasses: Sequence[DispersionCoefficients],
+    wavelengths: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """複数硝材の屈折率を複数波長について一括計算する。
+
+    Sellmeier式とSchott式の硝材が混在していても、式ごとに係数行列を
+    まとめて硝材×波長の配列として評価します。
+
+    Args:
+        glasses (Sequence[DispersionCoefficients]): 各硝材の分散式係数。
+        wavelengths (Sequence[float] | np.ndarray): 波長[nm]の1次元配列。
+
+    Returns:
+        np.ndarray: 屈折率の配列（形状(硝材数, 波長数)）。
+            分散式の極付近や0以下の波長など屈折率が求まらない点はNaN。
+    """
+
+    lam = np.asarray(wavelengths, dtype=float) / NM_PER_UM
+    if lam.ndim != 1:
+        raise ValueError("wavelengthsは1次元である必要があります。")
+    lam2 = lam**2
+    n2 = np.full((len(glasses), lam.shape[0]), np.nan)
+
+    sellmeier = [
+        i for i, g in enumerate(glasses) if isinstance(g, SellmeierCoefficients)
+    ]
+    schott = [i for i, g in enumerate(glasses) if isinstance(g, SchottCoefficients)]
+    if len(sellmeier) + len(schott) != len(glasses):
+        raise TypeError("glassesの要素は分散式係数である必要があります。")
+
+    if sellmeier:
+        b = np.array([[glasses[i].b1, glasses[i].b2, glasses[i].b3] for i in sellmeier])
+        c = np.array([[glasses[i].c1, glasses[i].c2, glasses[i].c3] for i in sellmeier])
+        # (硝材, 項, 波長) で評価して項方向に和をとる
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = b[:, :, np.newaxis] * lam2 / (lam2 - c[:, :, np.newaxis])
+        n2[sellmeier] = 1.0 + terms.sum(axis=1)
+
+    if schott:
+        a = np.array(
+            [
+                [
+                    glasses[i].a0,
+                    glasses[i].a1,
+                    glasses[i].a2,
+                    glasses[i].a3,
+                    glasses[i].a4,
+                    glasses[i].a5,
+                ]
+                for i in schott
+            ]
+        )
+        with np.errstate(divide="ignore"):
+            powers = np.stack(
+                (np.ones_like(lam2), lam2, lam2**-1, lam2**-2, lam2**-3, lam2**-4)
+            )
+        n2[schott] = a @ powers
+
+    # 波長が0以下の点も分散式の適用範囲外として屈折率を求めない
+    defined = (n2 > 0) & (lam > 0)
+    with np.errstate(invalid="ignore"):
+        return np.where(defined, np.sqrt(np.where(defined, n2, 1.0)), np.nan)
+
+
+def calculate_focal_lengths(
+    radius1: np.ndarray,
+    radius2: np.ndarray,
+    thickness: np.ndarray,
+    refractive_index: np.ndarray,
+) -> np.ndarray:
+    """単レンズの焦点距離を配列のブロードキャストで一括計算する。
+
+    `calculate_focal_length()` と同じ式・正規化規則を配列に適用します。
+    曲率半径の平面はNaNまたは0、焦点距離の無限大は `np.inf` で表します。
+
+    Args:
+        radius1 (np.ndarray): R1面の曲率半径[mm]。
+        radius2 (np.ndarray): R2面の曲率半径[mm]。
+        thickness (np.ndarray): 中心厚[mm]。
+        refractive_index (np.ndarray): 屈折率。1未満またはNaNは1として扱う。
+
+    Returns:
+        np.ndarray: 入力をブロードキャストした形状の焦点距離[mm]。
+    """
+
+    r1 = np.asarray(radius1, dtype=float)
+    r2 = np.asarray(radius2, dtype=float)
+    r1_is_plane = np.isnan(r1) | (r1 == 0)
+    r2_is_plane = np.isnan(r2) | (r2 == 0)
+    r1 = np.where(r1_is_plane, PLANE_RADIUS, r1)
+    r2 = np.where(r2_is_plane, PLANE_RADIUS, r2)
+
+    n = np.asarray(refractive_index, dtype=float)
+    n = np.where(np.isnan(n) | (n < 1), 1.0, n)
+    t = np.nan_to_num(np.asarray(thickness, dtype=float), nan=0.0)
+
+    power = (n - 1.0) * (1.0 / r1 - 1.0 / r2 + (t * (n - 1.0)) / (n * r1 * r2))
+    infinite = (r1_is_plane & r2_is_plane) | (power == 0)
+    with np.errstate(divide="ignore"):
+        return np.where(infinite, np.inf, 1.0 / np.where(infinite, 1.0, power))
+
+
+def _element_columns(
+    elements: Sequence[LensElement],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def radius(value: float | None) -> float:
+        return np.nan if value is None else float(value)
+
+    r1 = np.array([radius(e.radius1) for e in elements])[:, np.newaxis]
+    r2 = np.array([radius(e.radius2) for e in elements])[:, np.newaxis]
+    t = np.array([float(e.thickness) for e in elements])[:, np.newaxis]
+    return r1, r2, t
+
+
+def calculate_chromatic_focal_lengths(
+    elements: Sequence[LensElement],
+    glasses: Sequence[DispersionCoefficients],
+    wavelengths: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """レンズテーブル×波長グリッドの焦点距離を一括計算する。
+
+    Args:
+        elements (Sequence[LensElement]): 各エレメントの形状。
+        glasses (Sequence[DispersionCoefficients]): 各エレメントの硝材の分散式係数。
+        wavelengths (Sequence[float] | np.ndarray): 波長[nm]。
+
+    Returns:
+        np.ndarray: 焦点距離[mm]の配列（形状(エレメント数, 波長数)）。
+            無限大は `np.inf`、屈折率が求まらない波長はNaN。
+    """
+
+    if len(elements) != len(glasses):
+        raise ValueError("elementsとglassesの要素数が一致しません。")
+    indices = calculate_refractive_indices(glasses, wavelengths)
+    r1, r2, t = _element_columns(elements)
+    focal = calculate_focal_lengths(r1, r2, t, indices)
+    # 「数値以外は1」の正規化は呼び出し元の入力に対する規則であり、
+    # 分散式から屈折率が求まらない点は無限大ではなく計算不可（NaN）とする
+    return np.where(np.isnan(indices), np.nan, focal)
+
+
+def calculate_longitudinal_chromatic_shift(
+    elements: Sequence[LensElement],
+    glasses: Sequence[DispersionCoefficients],
+    wavelengths: Sequence[float] | np.ndarray,
+    reference_wavelength: float = WAVELENGTH_D,
+) -> np.ndarray:
+    """基準波長に対する焦点距離の変化量（軸上色収差）を一括計算する。
+
+    Args:
+        elements (Sequence[LensElement]): 各エレメントの形状。
+        glasses (Sequence[DispersionCoefficients]): 各エレメントの硝材の分散式係数。
+        wavelengths (Sequence[float] | np.ndarray): 評価する波長[nm]。
+        reference_wavelength (float): 基準波長[nm]。既定はd線。
+
+    Returns:
+        np.ndarray: f(λ) - f(基準波長) [mm] の配列（形状(エレメント数, 波長数)）。
+            焦点距離が無限大となるエレメントと、屈折率が求まらない波長はNaN。
+    """
+
+    grid = np.append(np.asarray(wavelengths, dtype=float), reference_wavelength)
+    focal = calculate_chromatic_focal_lengths(elements, glasses, grid)
+    with np.errstate(invalid="ignore"):
+        shift = focal[:, :-1] - focal[:, -1:]
+    return np.where(np.isfinite(shift), shift, np.nan)
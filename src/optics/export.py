@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .calculations import AsphericCoefficients, LensElement
+from .mass_properties import calculate_mass_properties_batch
+from .profiles import calculate_sag_profiles
+
+# 出力ファイルのスキーマバージョン（列構成を変更した場合に更新する）
+SCHEMA_VERSION = 1
+# サグテーブルの既定分割数（中心から有効径端まで）
+SAG_TABLE_STEPS = 100
+
+_METADATA_VERSION_KEY = b"rapid_automation.schema_version"
+_METADATA_KIND_KEY = b"rapid_automation.table_kind"
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_FEATHER_SUFFIXES = (".feather", ".arrow")
+_COEFFICIENT_FIELDS = tuple(f.name for f in fields(AsphericCoefficients))
+
+
+def _require_pyarrow() -> Any:
+    """pyarrowを読み込む。未インストールの場合はImportErrorを送出する。"""
+
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Parquet/Feather出力にはpyarrowが必要です。"
+            "`uv sync --extra export` でインストールしてください。"
+        ) from error
+    return pyarrow
+
+
+@dataclass
+class TableMetadata:
+    """出力ファイルに埋め込むメタデータ。
+
+    Attributes:
+        schema_version (int): スキーマバージョン。
+        kind (str): テーブルの種類（"lens", "sag", "summary" など）。
+    """
+
+    schema_version: int
+    kind: str
+
+
+def _coefficient_columns(
+    coefficients: Sequence[AsphericCoefficients | None], surface: int
+) -> dict[str, list[float]]:
+    columns: dict[str, list[float]] = {}
+    for name in _COEFFICIENT_FIELDS:
+        columns[f"{name}_{surface}"] = [
+            0.0 if c is None else float(getattr(c, name)) for c in coefficients
+        ]
+    return columns
+
+
+def _radius_column(radii: Sequence[float | None]) -> list[float]:
+    # 平面（Noneまたは0）は欠損値として出力する
+    return [np.nan if r is None or r == 0 else float(r) for r in radii]
+
+
+def build_lens_table(
+    elements: Sequence[LensElement],
+    names: Sequence[str] | None = None,
+    design: str | None = None,
+) -> pd.DataFrame:
+    """エレメントの形状と質量特性を1行1エレメントのテーブルにまとめる。
+
+    Args:
+        elements (Sequence[LensElement]): 出力するエレメント。
+        names (Sequence[str] | None): エレメント名。省略時は"G01"からの連番。
+        design (str | None): 設計名。指定した場合はdesign列を追加する。
+
+    Returns:
+        pd.DataFrame: レンズテーブル。平面の曲率半径と計算不可の質量特性は欠損値。
+    """
+
+    if names is None:
+        names = [f"G{i + 1:02d}" for i in range(len(elements))]
+    if len(names) != len(elements):
+        raise ValueError("namesの要素数がelementsと一致しません。")
+
+    properties = calculate_mass_properties_batch(elements)
+    columns: dict[str, Any] = {}
+    if design is not None:
+        columns["design"] = [design] * len(elements)
+    columns.update(
+        {
+            "element": list(names),
+            "radius1": _radius_column([e.radius1 for e in elements]),
+            "radius2": _radius_column([e.radius2 for e in elements]),
+            "thickness": [float(e.thickness) for e in elements],
+            "specific_gravity": [float(e.specific_gravity) for e in elements],
+            "diameter1": [float(e.diameter1) for e in elements],
+            "diameter2": [float(e.diameter2) for e in elements],
+            "max_diameter": [float(e.max_diameter) for e in elements],
+        }
+    )
+    columns.update(_coefficient_columns([e.coefficients1 for e in elements], 1))
+    columns.update(_coefficient_columns([e.coefficients2 for e in elements], 2))
+    for name in ("mass", "center_of_gravity", "axial_inertia", "transverse_inertia"):
+        columns[name] = [np.nan if p is None else getattr(p, name) for p in properties]
+    return pd.DataFrame(columns)
+
+
+def build_sag_table(
+    radii: Sequence[float | None],
+    diameters: Sequence[float],
+    coefficients: Sequence[AsphericCoefficients | None] | None = None,
+    names: Sequence[str] | None = None,
+    steps: int = SAG_TABLE_STEPS,
+    design: str | None = None,
+) -> pd.DataFrame:
+    """面×高さのサグ量を縦持ち（1行1標本点）のテーブルにまとめる。
+
+    全面のサグ量は `calculate_sag_profiles()` で一括評価します。
+
+    Args:
+        radii (Sequence[float | None]): 各面の曲率半径[mm]。
+        diameters (Sequence[float]): 各面の有効径[mm]。
+        coefficients (Sequence[AsphericCoefficients | None] | None): 各面の非球面係数。
+        names (Sequence[str] | None): 面名。省略時は"S1"からの連番。
+        steps (int): 中心から有効径端までの分割数。
+        design (str | None): 設計名。指定した場合はdesign列を追加する。
+
+    Returns:
+        pd.DataFrame: surface, height, sag 列を持つサグテーブル。
+            計算不可の点のサグ量は欠損値。
+    """
+
+    if len(diameters) != len(radii):
+        raise ValueError("radiiとdiametersの要素数が一致しません。")
+    if names is None:
+        names = [f"S{i + 1}" for i in range(len(radii))]
+    if len(names) != len(radii):
+        raise ValueError("namesの要素数がradiiと一致しません。")
+    if steps < 1:
+        raise ValueError("stepsは1以上である必要があります。")
+
+    effective_radii = np.array([float(d) / 2.0 for d in diameters])
+    ratios = np.linspace(0.0, 1.0, steps + 1)
+    heights = effective_radii[:, np.newaxis] * ratios
+    sag = calculate_sag_profiles(radii, heights, coefficients)
+
+    columns: dict[str, Any] = {}
+    if design is not None:
+        columns["design"] = pd.Categorical([design] * heights.size)
+    columns["surface"] = pd.Categorical(np.repeat(np.asarray(names), steps + 1))
+    columns["height"] = heights.ravel()
+    columns["sag"] = sag.ravel()
+    return pd.DataFrame(columns)
+
+
+def build_summary_table(
+    lens_table: pd.DataFrame, sag_table: pd.DataFrame | None = None
+) -> pd.DataFrame:
+    """レンズテーブル・サグテーブルから設計ごとの集計値を1行1設計にまとめる。
+
+    Args:
+        lens_table (pd.DataFrame): design列を持つ `build_lens_table()` の出力。
+            複数設計を連結したものでもよい。
+        sag_table (pd.DataFrame | None): design列を持つ `build_sag_table()` の出力。
+            指定した場合は面数とサグ量の集計列を追加する。
+
+    Returns:
+        pd.DataFrame: design, element_count, total_mass, total_thickness,
+            max_diameter 列（sag_table指定時は surface_count, max_abs_sag,
+            undefined_sag_count 列も）を持つサマリーテーブル。
+            質量を計算できないエレメントを含む設計の total_mass は欠損値。
+
+    Raises:
+        ValueError: テーブルにdesign列がない場合。
+    """
+
+    for name, table in (("lens_table", lens_table), ("sag_table", sag_table)):
+        if table is not None and "design" not in table.columns:
+            raise ValueError(f"{name}にdesign列がありません。")
+
+    lenses = lens_table.groupby("design", sort=False, observed=True)
+    summary = pd.DataFrame(
+        {
+            "element_count": lenses.size(),
+            # 1エレメントでも質量が計算できない場合は合計も欠損値とする
+            "total_mass": lenses["mass"].agg(lambda m: m.sum(skipna=False)),
+            "total_thickness": lenses["thickness"].sum(),
+            "max_diameter": lenses["max_diameter"].max(),
+        }
+    )
+    if sag_table is not None:
+        sags = sag_table.groupby("design", sort=False, observed=True)
+        summary = summary.join(
+            pd.DataFrame(
+                {
+                    "surface_count": sags["surface"].nunique(),
+                    "max_abs_sag": sags["sag"].agg(lambda z: z.abs().max()),
+                    "undefined_sag_count": sags["sag"].agg(lambda z: z.isna().sum()),
+                }
+            )
+        )
+    summary.index = summary.index.astype(str)
+    return summary.rename_axis("design").reset_index()
+
+
+def _infer_format(path: Path, file_format: str | None) -> str:
+    if file_format is not None:
+        if file_format not in ("parquet", "feather"):
+            raise ValueError(f"未対応の形式です: {file_format}")
+        return file_format
+    suffix = path.suffix.lower()
+    if suffix in _PARQUET_SUFFIXES:
+        return "parquet"
+    if suffix in _FEATHER_SUFFIXES:
+        return "feather"
+    raise ValueError(f"拡張子から形式を判定できません: {path}")
+
+
+def write_table(
+    table: pd.DataFrame,
+    path: str | Path,
+    kind: str,
+    file_format: str | None = None,
+    compression: str | None = "zstd",
+) -> Path:
+    """テーブルをスキーマバージョン付きの列指向ファイルに書き出す。
+
+    Feather形式を `compression=None` で書き出すと、読み込み時に
+    メモリマップによるゼロコピー参照が可能になります。
+
+    Args:
+        table (pd.DataFrame): 書き出すテーブル。
+        path (str | Path): 出力先。拡張子 .parquet/.feather/.arrow から形式を判定する。
+        kind (str): テーブルの種類（"lens", "sag", "summary" など）。
+        file_format (str | None): "parquet" または "feather"。省略時は拡張子から判定。
+        compression (str | None): 圧縮方式（"zstd", "lz4" など）。Noneは無圧縮。
+
+    Returns:
+        Path: 出力したファイルのパス。
+    """
+
+    pa = _require_pyarrow()
+    path = Path(path)
+    file_format = _infer_format(path, file_format)
+
+    arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+    metadata = dict(arrow_table.schema.metadata or {})
+    metadata[_METADATA_VERSION_KEY] = str(SCHEMA_VERSION).encode("ascii")
+    metadata[_METADATA_KIND_KEY] = kind.encode("utf-8")
+    arrow_table = arrow_table.replace_schema_metadata(metadata)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(arrow_table, path, compression=compression or "none")
+    else:
+        from pyarrow import feather
+
+        feather.write_feather(
+            arrow_table, path, compression=compression or "uncompressed"
+        )
+    return path
+
+
+def _validate_metadata(schema: Any, path: Path) -> TableMetadata:
+    metadata = schema.metadata or {}
+    if _METADATA_VERSION_KEY not in metadata:
+        raise ValueError(f"スキーマバージョンが記録されていません: {path}")
+    version = int(metadata[_METADATA_VERSION_KEY])
+    if version > SCHEMA_VERSION:
+        raise ValueError(
+            f"未対応のスキーマバージョンです: {version}（対応: {SCHEMA_VERSION}以下）"
+        )
+    return TableMetadata(
+        schema_version=version,
+        kind=metadata.get(_METADATA_KIND_KEY, b"").decode("utf-8"),
+    )
+
+
+def read_arrow_table(
+    path: str | Path, columns: Sequence[str] | None = None
+) -> tuple[Any, TableMetadata]:
+    """列指向ファイルをメモリマップで読み込み、Arrowテーブルとして返す。
+
+    無圧縮Featherファイルの場合、列データはファイルのメモリマップを
+    直接参照し、コピーは発生しません。
+
+    Args:
+        path (str | Path): 読み込むファイル。
+        columns (Sequence[str] | None): 読み込む列。省略時はすべての列。
+
+    Returns:
+        tuple[pyarrow.Table, TableMetadata]: Arrowテーブルとメタデータ。
+
+    Raises:
+        ValueError: スキーマバージョンが未記録または未対応の場合。
+    """
+
+    _require_pyarrow()
+    path = Path(path)
+    selected = None if columns is None else list(columns)
+    if _infer_format(path, None) == "parquet":
+        import pyarrow.parquet as pq
+
+        arrow_table = pq.read_table(path, columns=selected, memory_map=True)
+    else:
+        from pyarrow import feather
+
+        arrow_table = feather.read_table(path, columns=selected, memory_map=True)
+    return arrow_table, _validate_metadata(arrow_table.schema, path)
+
+
+def read_table(
+    path: str | Path, columns: Sequence[str] | None = None
+) -> tuple[pd.DataFrame, TableMetadata]:
+    """列指向ファイルをメモリマップで読み込み、DataFrameとして返す。
+
+    Args:
+        path (str | Path): 読み込むファイル。
+        columns (Sequence[str] | None): 読み込む列。省略時はすべての列。
+
+    Returns:
+        tuple[pd.DataFrame, TableMetadata]: テーブルとメタデータ。
+    """
+
+    arrow_table, metadata = read_arrow_table(path, columns)
+    # 列ごとにブロックを分けて変換し、可能な列はコピーせずに参照する
+    return arrow_table.to_pandas(split_blocks=True), metadata
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .calculations import AsphericCoefficients, LensElement, _validate_number
+from .profiles import calculate_sag_profiles
+
+# VBA版 GlassWeight と同じ積分分割数
+INTEGRATION_STEPS = 100
+# mm^3 → cm^3 の換算係数
+MM3_PER_CM3 = 1000.0
+
+
+@dataclass
+class MassProperties:
+    """レンズまたは組立品の質量特性を保持するデータクラス。
+
+    Attributes:
+        mass (float): 質量[g]。
+        center_of_gravity (float): 重心の光軸方向位置[mm]。
+            単レンズではR1面頂点、組立品では先頭エレメントのR1面頂点を原点とする。
+        axial_inertia (float): 光軸まわりの慣性モーメント[g·mm^2]。
+        transverse_inertia (float): 重心を通り光軸に直交する軸まわりの
+            慣性モーメント[g·mm^2]。
+    """
+
+    mass: float
+    center_of_gravity: float
+    axial_inertia: float
+    transverse_inertia: float
+
+
+def _sample_surfaces(
+    radii: Sequence[float | None],
+    coefficients: Sequence[AsphericCoefficients | None],
+    effective_radii: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """各面の有効径内を積分分割数で等分した高さと、そのサグ量を一括計算する。
+
+    Args:
+        radii: 各面の曲率半径[mm]。
+        coefficients: 各面の非球面係数。
+        effective_radii: 各面の有効半径[mm]（形状(n,)）。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 高さ(n, N+1)とサグ量(n, N+1)。
+            サグ計算に失敗した点はNaN。
+    """
+
+    steps = np.arange(INTEGRATION_STEPS + 1, dtype=float)
+    heights = (effective_radii / INTEGRATION_STEPS)[:, np.newaxis] * steps
+    return heights, calculate_sag_profiles(radii, heights, coefficients)
+
+
+def _disc_integrals(
+    values: np.ndarray,
+    heights: np.ndarray,
+    max_radii: np.ndarray,
+    power: int = 0,
+) -> np.ndarray:
+    """面位置の関数 f の最大外径までの円板上の回転体積分を求める。
+
+    有効径より外側は有効径端の値で一定とみなす（VBA版の外周補正と同じ扱い）。
+    離散化はVBA版の体積積分を一般化した次式による::
+
+        ∫2πh·h^(2p)·f dh ≈ π/(p+1)·[Rmax^(2p+2)·f_N - Σ avg(h^(2p+2))·Δf]
+
+    f = Z, p = 0 のときVBA版の体積計算と完全に一致する。
+
+    Args:
+        values: 高さ標本上の f の値。形状(n, m)または(n, k, m)。
+        heights: 高さ標本[mm]（形状(n, m)）。
+        max_radii: 最大外半径[mm]（形状(n,)）。
+        power: 被積分関数に掛ける h^(2p) の次数p。
+
+    Returns:
+        np.ndarray: 積分値。形状は values から最後の軸を除いたもの。
+    """
+
+    order = 2 * power + 2
+    h_order = heights**order
+    h_avg = (h_order[:, 1:] + h_order[:, :-1]) / 2.0
+    # values の中間の軸（f の種類）に合わせて次元を揃える
+    extra = (1,) * (values.ndim - 2)
+    h_avg = h_avg.reshape(h_avg.shape[0], *extra, h_avg.shape[1])
+    r_order = (max_radii**order).reshape(-1, *extra)
+    return (np.pi / (power + 1)) * (
+        r_order * values[..., -1] - np.sum(h_avg * np.diff(values, axis=-1), axis=-1)
+    )
+
+
+def _surface_integrals(
+    radii: Sequence[float | None],
+    coefficients: Sequence[AsphericCoefficients | None],
+    effective_radii: np.ndarray,
+    max_radii: np.ndarray,
+    offsets: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """各面の位置 Z(h) に対する回転体積分を同一のサグ標本から求める。
+
+    面位置 Z = offset + sag(h) について、最大外径までの円板上で
+    ∫2πh f(Z) dh および ∫2πh h² Z dh を `_disc_integrals()` で評価する。
+
+    Args:
+        radii: 各面の曲率半径[mm]。
+        coefficients: 各面の非球面係数。
+        effective_radii: 各面の有効半径[mm]（形状(n,)）。
+        max_radii: 各エレメントの最大外半径[mm]（形状(n,)）。
+        offsets: 各面頂点の光軸方向位置[mm]（形状(n,)）。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: f = Z, Z²/2, Z³/3 に対する積分値(n, 3)と、
+            ∫2πh h² Z dh の値(n,)。サグ計算に失敗した面はNaNを含む。
+    """
+
+    heights, sag = _sample_surfaces(radii, coefficients, effective_radii)
+    z = offsets[:, np.newaxis] + sag
+
+    # f(Z) = Z, Z²/2, Z³/3 （それぞれ 1, Z, Z² の原始関数）
+    f = np.stack((z, z**2 / 2.0, z**3 / 3.0), axis=1)
+    moments = _disc_integrals(f, heights, max_radii)
+    radial = _disc_integrals(z, heights, max_radii, power=1)
+    return moments, radial
+
+
+def calculate_mass_properties_batch(
+    elements: Sequence[LensElement],
+) -> list[MassProperties | None]:
+    """複数エレメントの質量・重心・慣性モーメントを一括計算する。
+
+    各面のサグ量を一度だけ標本化し、その標本から体積と各次モーメントを
+    同時に積分します。質量は `calculate_glass_weight()` と同じ値になります。
+
+    Args:
+        elements (Sequence[LensElement]): 計算対象のエレメント。
+
+    Returns:
+        list[MassProperties | None]: エレメントごとの質量特性。
+            サグ計算に失敗したエレメントはNoneとなる。
+    """
+
+    if len(elements) == 0:
+        return []
+
+    thickness = np.array([float(e.thickness) for e in elements])
+    specific_gravity = np.array([float(e.specific_gravity) for e in elements])
+    max_radii = np.array([float(e.max_diameter) / 2.0 for e in elements])
+
+    moments1, radial1 = _surface_integrals(
+        [e.radius1 for e in elements],
+        [e.coefficients1 for e in elements],
+        np.array([float(e.diameter1) / 2.0 for e in elements]),
+        max_radii,
+        np.zeros(len(elements)),
+    )
+    moments2, radial2 = _surface_integrals(
+        [e.radius2 for e in elements],
+        [e.coefficients2 for e in elements],
+        np.array([float(e.diameter2) / 2.0 for e in elements]),
+        max_radii,
+        thickness,
+    )
+
+    # 硝材はR1面(Z1)とR2面(Z2 = t + sag2)に挟まれた領域
+    volume, first_moment, second_moment = (moments2 - moments1).T
+    radial = radial2 - radial1
+
+    density = specific_gravity / MM3_PER_CM3
+    mass = density * volume
+    # 体積0（厚み0の平行平板など）の場合は重心を原点とする
+    safe_volume = np.where(volume != 0, volume, 1.0)
+    center = np.where(volume != 0, first_moment / safe_volume, 0.0)
+    axial = density * radial
+    # 軸対称体では ∫y² dm = Izz / 2 となる
+    transverse = density * (radial / 2.0 + second_moment) - mass * center**2
+
+    results: list[MassProperties | None] = []
+    for i in range(len(elements)):
+        if np.isnan(mass[i]) or np.isnan(axial[i]) or np.isnan(transverse[i]):
+            results.append(None)
+            continue
+        results.append(
+            MassProperties(
+                mass=float(mass[i]),
+                center_of_gravity=float(center[i]),
+                axial_inertia=float(axial[i]),
+                transverse_inertia=float(transverse[i]),
+            )
+        )
+    return results
+
+
+def calculate_mass_properties(element: LensElement) -> MassProperties | None:
+    """単レンズの質量・重心・慣性モーメントを計算する。
+
+    Args:
+        element (LensElement): 計算対象のエレメント。
+
+    Returns:
+        MassProperties | None: 質量特性。サグ計算に失敗した場合はNoneを返す。
+    """
+
+    return calculate_mass_properties_batch([element])[0]
+
+
+def combine_mass_properties(
+    properties: Sequence[MassProperties],
+    positions: Sequence[float],
+) -> MassProperties:
+    """配置位置を考慮して複数の質量特性を合成する。
+
+    Args:
+        properties (Sequence[MassProperties]): 合成する質量特性。
+        positions (Sequence[float]): 各質量特性の原点の光軸方向位置[mm]。
+
+    Returns:
+        MassProperties: 合成後の質量特性。重心と慣性モーメントは合成後の重心基準。
+    """
+
+    if len(properties) != len(positions):
+        raise ValueError("propertiesとpositionsの要素数が一致しません。")
+    if len(properties) == 0:
+        raise ValueError("propertiesが空です。")
+
+    total_mass = sum(p.mass for p in properties)
+    centers = [
+        float(position) + p.center_of_gravity
+        for p, position in zip(properties, positions)
+    ]
+    if total_mass == 0:
+        center = centers[0]
+    else:
+        center = sum(p.mass * z for p, z in zip(properties, centers)) / total_mass
+
+    # 平行軸の定理で合成重心まわりに移す
+    transverse = sum(
+        p.transverse_inertia + p.mass * (z - center) ** 2
+        for p, z in zip(properties, centers)
+    )
+    return MassProperties(
+        mass=total_mass,
+        center_of_gravity=center,
+        axial_inertia=sum(p.axial_inertia for p in properties),
+        transverse_inertia=transverse,
+    )
+
+
+def calculate_assembly_mass_properties(
+    elements: Sequence[LensElement],
+    air_gaps: Sequence[float],
+) -> MassProperties | None:
+    """エレメント間隔を考慮して組立品（群・接合レンズ）の質量特性を計算する。
+
+    Args:
+        elements (Sequence[LensElement]): 光軸に沿って並んだエレメント。
+        air_gaps (Sequence[float]): 各エレメントのR2面頂点から次のエレメントの
+            R1面頂点までの間隔[mm]。要素数は `len(elements) - 1`。接合面は0。
+
+    Returns:
+        MassProperties | None: 組立品の質量特性。重心は先頭エレメントの
+            R1面頂点基準。いずれかのエレメントでサグ計算に失敗した場合はNoneを返す。
+    """
+
+    if len(elements) == 0:
+        raise ValueError("elementsが空です。")
+    if len(air_gaps) != len(elements) - 1:
+        raise ValueError("air_gapsの要素数はelementsの要素数-1である必要があります。")
+    for gap in air_gaps:
+        _validate_number(gap, "air_gaps")
+
+    properties = calculate_mass_properties_batch(elements)
+    if any(p is None for p in properties):
+        return None
+
+    positions = [0.0]
+    for element, gap in zip(elements[:-1], air_gaps):
+        positions.append(positions[-1] + float(element.thickness) + float(gap))
+
+    return combine_mass_properties(properties, positions)  # type: ignore[arg-type]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from .calculations import AsphericCoefficients, _is_number
+
+# 非球面係数の次数（A4～A14）
+ASPHERIC_ORDERS = (4, 6, 8, 10, 12, 14)
+
+
+def curvature_array(radii: Sequence[float | None]) -> np.ndarray:
+    """曲率半径の並びを曲率の配列に変換する。
+
+    Args:
+        radii (Sequence[float | None]): 曲率半径[mm]の並び。Noneまたは0は平面として扱う。
+
+    Returns:
+        np.ndarray: 曲率[1/mm]の1次元配列。平面は0となる。
+    """
+
+    curvatures = np.zeros(len(radii), dtype=float)
+    for i, radius in enumerate(radii):
+        if radius is None or radius == 0:
+            continue
+        if not _is_number(radius):
+            raise TypeError("radiusは数値である必要があります。")
+        curvatures[i] = 1.0 / float(radius)
+    return curvatures
+
+
+def coefficient_arrays(
+    coefficients: Sequence[AsphericCoefficients | None],
+) -> tuple[np.ndarray, np.ndarray]:
+    """非球面係数の並びをコーニック定数と多項式係数の配列に変換する。
+
+    Args:
+        coefficients (Sequence[AsphericCoefficients | None]): 各面の非球面係数。
+            Noneは球面として扱う。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: コーニック定数の配列(n,)と、
+            A4～A14の係数行列(n, 6)。
+    """
+
+    conics = np.zeros(len(coefficients), dtype=float)
+    polynomial = np.zeros((len(coefficients), len(ASPHERIC_ORDERS)), dtype=float)
+    for i, coefficient in enumerate(coefficients):
+        if coefficient is None:
+            continue
+        conics[i] = coefficient.conic
+        polynomial[i] = (
+            coefficient.a4,
+            coefficient.a6,
+            coefficient.a8,
+            coefficient.a10,
+            coefficient.a12,
+            coefficient.a14,
+        )
+    return conics, polynomial
+
+
+def _prepare_surfaces(
+    radii: Sequence[float | None],
+    heights: np.ndarray,
+    coefficients: Sequence[AsphericCoefficients | None] | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """面形状と高さ配列を検証し、一括評価用の配列に整形する。
+
+    Returns:
+        tuple: 曲率の列ベクトル(n, 1)、A4～A14の係数行列(n, 6)、
+            高さ配列(n, m)、平方根の引数 1-(1+K)c²h² の配列(n, m)。
+    """
+
+    c = curvature_array(radii)
+    if coefficients is None:
+        coefficients = [None] * len(radii)
+    if len(coefficients) != len(radii):
+        raise ValueError("radiiとcoefficientsの要素数が一致しません。")
+    conics, polynomial = coefficient_arrays(coefficients)
+
+    h = np.asarray(heights, dtype=float)
+    if h.ndim == 1:
+        h = np.broadcast_to(h, (len(radii), h.shape[0]))
+    elif h.ndim != 2 or h.shape[0] != len(radii):
+        raise ValueError("heightsの形状が面数と一致しません。")
+
+    c_col = c[:, np.newaxis]
+    arg = 1.0 - (1.0 + conics[:, np.newaxis]) * (c_col**2) * (h * h)
+    return c_col, polynomial, h, arg
+
+
+def calculate_sag_profiles(
+    radii: Sequence[float | None],
+    heights: np.ndarray,
+    coefficients: Sequence[AsphericCoefficients | None] | None = None,
+) -> np.ndarray:
+    """複数面のサグ量を高さ配列に対して一括計算する。
+
+    `calculate_sag()` と同じ式を面×高さの2次元配列に対してまとめて評価します。
+    平方根の引数が負になる点（サグ計算不可）はNaNとなります。
+
+    Args:
+        radii (Sequence[float | None]): 各面の曲率半径[mm]。Noneまたは0は平面扱い。
+        heights (np.ndarray): 光軸からの高さ[mm]。形状(m,)の場合は全面共通、
+            形状(n, m)の場合は面ごとの高さとして扱う。
+        coefficients (Sequence[AsphericCoefficients | None] | None): 各面の非球面係数。
+            省略時はすべて球面として扱う。
+
+    Returns:
+        np.ndarray: サグ量[mm]の配列（形状(n, m)）。計算不可能な点はNaN。
+    """
+
+    c_col, polynomial, h, arg = _prepare_surfaces(radii, heights, coefficients)
+    h2 = h * h
+    with np.errstate(invalid="ignore"):
+        base = (c_col * h2) / (1.0 + np.sqrt(arg))
+    base = np.where(arg < 0, np.nan, base)
+
+    # ホーナー法で A4*h^4 + A6*h^6 + ... + A14*h^14 を評価する
+    aspheric = np.zeros_like(h2)
+    for j in range(len(ASPHERIC_ORDERS) - 1, -1, -1):
+        aspheric = aspheric * h2 + polynomial[:, j : j + 1]
+    aspheric = aspheric * h2 * h2
+    return base + aspheric
+
+
+def calculate_sag_derivatives(
+    radii: Sequence[float | None],
+    heights: np.ndarray,
+    coefficients: Sequence[AsphericCoefficients | None] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """複数面のサグ量の1階・2階微分を高さ配列に対して解析的に一括計算する。
+
+    サグ式を高さhで微分した次式を面×高さの2次元配列に対して評価します::
+
+        z'(h)  = c·h / √(1-(1+K)c²h²) + Σ 2j·A2j·h^(2j-1)
+        z''(h) = c / (1-(1+K)c²h²)^(3/2) + Σ 2j(2j-1)·A2j·h^(2j-2)
+
+    Args:
+        radii (Sequence[float | None]): 各面の曲率半径[mm]。Noneまたは0は平面扱い。
+        heights (np.ndarray): 光軸からの高さ[mm]。形状(m,)または(n, m)。
+        coefficients (Sequence[AsphericCoefficients | None] | None): 各面の非球面係数。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 1階微分（面の傾き）と2階微分の配列
+            （いずれも形状(n, m)）。サグ計算不可能な点はNaN。
+    """
+
+    c_col, polynomial, h, arg = _prepare_surfaces(radii, heights, coefficients)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(arg)
+        first = c_col * h / root
+        second = c_col / (arg * root)
+    first = np.where(arg <= 0, np.nan, first)
+    second = np.where(arg <= 0, np.nan, second)
+
+    # 非球面項の微分（h^(2j) → 2j·h^(2j-1), 2j(2j-1)·h^(2j-2)）
+    for j, order in enumerate(ASPHERIC_ORDERS):
+        a = polynomial[:, j : j + 1]
+        first = first + order * a * h ** (order - 1)
+        second = second + order * (order - 1) * a * h ** (order - 2)
+    return first, second
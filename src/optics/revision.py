@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+
+import numpy as np
+
+from .profiles import calculate_sag_profiles
+from .seq_file import SeqDesign, SeqSurface
+
+# 中心から有効径端までの既定分割数
+REVISION_STEPS = 200
+# 形状が変化したとみなすサグ差の既定閾値[mm]
+DEFAULT_TOLERANCE = 1e-5
+
+STATUS_UNCHANGED = "unchanged"
+STATUS_CHANGED = "changed"
+STATUS_ADDED = "added"
+STATUS_REMOVED = "removed"
+STATUS_UNDEFINED = "undefined"
+
+
+@dataclass
+class SurfaceDiff:
+    """1面分の改版差分を保持するデータクラス。
+
+    Attributes:
+        name (str | None): 新設計の面名。削除面はNone。
+        status (str): 判定結果（STATUS_* のいずれか）。
+        max_deviation (float): 有効径内のサグ差の絶対値の最大[mm]。評価しない場合はNaN。
+        rms_deviation (float): 有効径内のサグ差の面積加重RMS[mm]。評価しない場合はNaN。
+        max_deviation_height (float): サグ差が最大となる高さ[mm]。評価しない場合はNaN。
+        spacing_changed (bool): 面間隔または硝材が変化した場合にTrue。
+        diameter_changed (bool): 有効径が変化した場合にTrue。
+        old_name (str | None): 対応付けた旧設計の面名。追加面はNone。
+    """
+
+    name: str | None
+    status: str
+    max_deviation: float = float("nan")
+    rms_deviation: float = float("nan")
+    max_deviation_height: float = float("nan")
+    spacing_changed: bool = False
+    diameter_changed: bool = False
+    old_name: str | None = None
+
+    @property
+    def renamed(self) -> bool:
+        """面の挿入・削除により面名（面番号）が変わった場合にTrue。"""
+        return (
+            self.name is not None
+            and self.old_name is not None
+            and self.name != self.old_name
+        )
+
+    @property
+    def needs_update(self) -> bool:
+        """サグ表・重量・図面の再生成が必要な場合にTrue。
+
+        面名をキーとする出力の見出しが変わるため、面名が変わった面も対象とする。
+        """
+        return (
+            self.status != STATUS_UNCHANGED
+            or self.spacing_changed
+            or self.diameter_changed
+            or self.renamed
+        )
+
+
+@dataclass
+class RevisionDiff:
+    """設計改版の差分を保持するデータクラス。
+
+    Attributes:
+        old_title (str): 旧設計名。
+        new_title (str): 新設計名。
+        surfaces (list[SurfaceDiff]): 面ごとの差分（新設計の面順、削除面は末尾）。
+    """
+
+    old_title: str
+    new_title: str
+    surfaces: list[SurfaceDiff] = field(default_factory=list)
+
+    @property
+    def changed_surfaces(self) -> list[str]:
+        """新設計で再生成が必要な面名（新設計の面名）の一覧。削除面は含まない。"""
+        return [s.name for s in self.surfaces if s.name is not None and s.needs_update]
+
+    @property
+    def removed_surfaces(self) -> list[str]:
+        """削除された面名（旧設計の面名）の一覧。"""
+        return [
+            s.old_name
+            for s in self.surfaces
+            if s.status == STATUS_REMOVED and s.old_name is not None
+        ]
+
+
+def _same_shape(old: SeqSurface, new: SeqSurface) -> bool:
+    # 曲率半径のNoneと0はいずれも平面を表す
+    same_radius = (old.radius or None) == (new.radius or None)
+    return same_radius and old.coefficients == new.coefficients
+
+
+def _alignment_key(
+    surface: SeqSurface,
+) -> tuple[float | None, float | None, str | None]:
+    return surface.radius or None, surface.thickness, surface.glass
+
+
+def _curvature(surface: SeqSurface) -> float:
+    return 1.0 / surface.radius if surface.radius else 0.0
+
+
+def _pair_by_shape(
+    old: list[SeqSurface], new: list[SeqSurface]
+) -> list[tuple[SeqSurface | None, SeqSurface | None]]:
+    """一致しない区間の面を、並び順を保ったまま曲率差の合計が最小となるよう組にする。
+
+    面数の少ない側の面はすべて組にし、多い側の余った面は追加または削除とします。
+    """
+
+    swapped = len(old) > len(new)
+    short, long = (new, old) if swapped else (old, new)
+
+    def distance(i: int, j: int) -> float:
+        return abs(_curvature(short[i]) - _curvature(long[j]))
+
+    # cost[i][j]: short の先頭i面を long の先頭j面のいずれかと組にしたときの最小コスト
+    cost = [[math.inf] * (len(long) + 1) for _ in range(len(short) + 1)]
+    cost[0] = [0.0] * (len(long) + 1)
+    for i in range(1, len(short) + 1):
+        for j in range(i, len(long) + 1):
+            cost[i][j] = min(
+                cost[i][j - 1], cost[i - 1][j - 1] + distance(i - 1, j - 1)
+            )
+
+    pairs: list[tuple[SeqSurface | None, SeqSurface]] = []
+    i = len(short)
+    for j in range(len(long), 0, -1):
+        if i > 0 and cost[i][j] == cost[i - 1][j - 1] + distance(i - 1, j - 1):
+            pairs.append((short[i - 1], long[j - 1]))
+            i -= 1
+        else:
+            pairs.append((None, long[j - 1]))
+    pairs.reverse()
+    # 組は (short, long) の順のため、旧面・新面の順に並べ替える
+    if swapped:
+        return [(o, n) for n, o in pairs]
+    return [(o, n) for o, n in pairs]
+
+
+def _align_surfaces(
+    old: list[SeqSurface], new: list[SeqSurface]
+) -> Iterator[tuple[SeqSurface | None, SeqSurface | None]]:
+    """新旧の面の並びを対応付け、(旧面, 新面) の組を新設計の面順に返す。
+
+    曲率半径・面間隔・硝材の一致する面の並びを `SequenceMatcher` で対応付けるため、
+    面の挿入・削除で以降の面番号がずれても正しい面同士を比較できます。
+    一致しない区間は `_pair_by_shape()` で曲率の近い面同士を組にし、
+    余った面は追加（旧面None）または削除（新面None）とします。
+    """
+
+    matcher = SequenceMatcher(
+        None,
+        [_alignment_key(s) for s in old],
+        [_alignment_key(s) for s in new],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            yield from zip(old[i1:i2], new[j1:j2], strict=True)
+        else:
+            yield from _pair_by_shape(old[i1:i2], new[j1:j2])
+
+
+def _effective_diameter(old: SeqSurface, new: SeqSurface) -> float | None:
+    diameters = [d for d in (old.diameter, new.diameter) if d is not None and d > 0]
+    return max(diameters) if diameters else None
+
+
+def compare_surfaces(
+    old: list[SeqSurface],
+    new: list[SeqSurface],
+    tolerance: float = DEFAULT_TOLERANCE,
+    steps: int = REVISION_STEPS,
+) -> list[SurfaceDiff]:
+    """新旧2つの面リストを対応付け、サグ差を一括評価する。
+
+    面は面名ではなく曲率半径・面間隔・硝材の並びで対応付けるため、
+    面の挿入・削除があっても以降の面を正しく比較できます。
+    曲率半径と非球面係数が一致する面はサグを評価せずに unchanged とします。
+    それ以外の面は新旧の有効径の大きい方の範囲で、新旧すべての面のサグを
+    1回の配列演算でまとめて計算し、差の最大値と面積加重RMSを求めます。
+    最大値が `tolerance` 以下の面は unchanged とします。
+    形状が unchanged でも、面間隔・硝材・有効径が変化した面は
+    `SurfaceDiff.needs_update` がTrueとなります。
+
+    Args:
+        old (list[SeqSurface]): 旧設計の面データ。
+        new (list[SeqSurface]): 新設計の面データ。
+        tolerance (float): 形状が変化したとみなすサグ差の閾値[mm]。
+        steps (int): 中心から有効径端までの分割数。
+
+    Returns:
+        list[SurfaceDiff]: 面ごとの差分（新設計の面順、削除面は末尾）。
+            有効径が不明、またはサグを計算できない面は undefined となる。
+            形状・間隔・有効径が同じでも、面名が変わった面は再生成の対象とする。
+    """
+
+    if steps < 1:
+        raise ValueError("stepsは1以上である必要があります。")
+    if tolerance < 0:
+        raise ValueError("toleranceは0以上である必要があります。")
+
+    diffs: list[SurfaceDiff] = []
+    removed: list[SurfaceDiff] = []
+    pending: list[tuple[SurfaceDiff, SeqSurface, SeqSurface, float]] = []
+    for previous, surface in _align_surfaces(old, new):
+        if previous is None or surface is None:
+            if surface is not None:
+                diffs.append(SurfaceDiff(surface.name, STATUS_ADDED))
+            elif previous is not None:
+                removed.append(
+                    SurfaceDiff(None, STATUS_REMOVED, old_name=previous.name)
+                )
+            continue
+        diff = SurfaceDiff(
+            surface.name,
+            STATUS_UNCHANGED,
+            spacing_changed=(
+                previous.thickness != surface.thickness
+                or previous.glass != surface.glass
+            ),
+            diameter_changed=previous.diameter != surface.diameter,
+            old_name=previous.name,
+        )
+        diffs.append(diff)
+        if _same_shape(previous, surface):
+            diff.max_deviation = diff.rms_deviation = 0.0
+            diff.max_deviation_height = 0.0
+            continue
+        diameter = _effective_diameter(previous, surface)
+        if diameter is None:
+            diff.status = STATUS_UNDEFINED
+            continue
+        pending.append((diff, previous, surface, diameter))
+    diffs.extend(removed)
+    if not pending:
+        return diffs
+
+    # 旧設計の面と新設計の面を縦に積み、サグを1回の配列演算で評価する
+    ratios = np.linspace(0.0, 1.0, steps + 1)
+    heights = np.array([d / 2.0 for *_, d in pending])[:, np.newaxis] * ratios
+    surfaces = [p[1] for p in pending] + [p[2] for p in pending]
+    sags = calculate_sag_profiles(
+        [s.radius for s in surfaces],
+        np.vstack([heights, heights]),
+        [s.coefficients for s in surfaces],
+    )
+    deviation = np.abs(sags[len(pending) :] - sags[: len(pending)])
+
+    # 輪帯の面積は高さに比例するため、高さを重みとしてRMSを求める
+    weights = heights / heights.sum(axis=1, keepdims=True)
+    rms = np.sqrt(np.sum(weights * deviation**2, axis=1))
+    undefined = np.isnan(deviation).any(axis=1)
+    peak_index = np.argmax(np.where(np.isnan(deviation), -np.inf, deviation), axis=1)
+
+    for i, (diff, *_) in enumerate(pending):
+        if undefined[i]:
+            diff.status = STATUS_UNDEFINED
+            continue
+        diff.max_deviation = float(deviation[i, peak_index[i]])
+        diff.rms_deviation = float(rms[i])
+        diff.max_deviation_height = float(heights[i, peak_index[i]])
+        if diff.max_deviation > tolerance:
+            diff.status = STATUS_CHANGED
+    return diffs
+
+
+def compare_designs(
+    old: SeqDesign,
+    new: SeqDesign,
+    tolerance: float = DEFAULT_TOLERANCE,
+    steps: int = REVISION_STEPS,
+) -> RevisionDiff:
+    """2つの設計データの面形状の差分を求める。
+
+    Args:
+        old (SeqDesign): 旧設計。
+        new (SeqDesign): 新設計。
+        tolerance (float): 形状が変化したとみなすサグ差の閾値[mm]。
+        steps (int): 中心から有効径端までの分割数。
+
+    Returns:
+        RevisionDiff: 面ごとの差分。
+    """
+
+    return RevisionDiff(
+        old_title=old.title,
+        new_title=new.title,
+        surfaces=compare_surfaces(old.surfaces, new.surfaces, tolerance, steps),
+    )
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from .calculations import AsphericCoefficients, _validate_number
+from .profiles import calculate_sag_derivatives
+
+# 中心から有効径端までの既定分割数
+SCREENING_STEPS = 1000
+# 1回の配列演算で評価する面数（メモリ使用量の上限を決める）
+DEFAULT_CHUNK_SIZE = 1024
+# 2階微分をゼロとみなす閾値[1/mm]
+CURVATURE_EPSILON = 1e-12
+
+VIOLATION_SAG_UNDEFINED = "sag_undefined"
+VIOLATION_SLOPE = "slope"
+VIOLATION_CURVATURE = "curvature"
+VIOLATION_INFLECTION = "inflection"
+
+
+@dataclass
+class ScreeningSurface:
+    """スクリーニング対象の1面を保持するデータクラス。
+
+    Attributes:
+        design (str): 設計名。
+        surface (str): 面名。
+        radius (float | None): 曲率半径[mm]。Noneまたは0の場合は平面。
+        diameter (float): 有効径[mm]。
+        coefficients (AsphericCoefficients | None): 非球面係数。省略時は球面。
+    """
+
+    design: str
+    surface: str
+    radius: float | None
+    diameter: float
+    coefficients: AsphericCoefficients | None = None
+
+    def __post_init__(self) -> None:
+        _validate_number(self.diameter, "diameter")
+
+
+@dataclass
+class ScreeningLimits:
+    """製造性スクリーニングの判定基準を保持するデータクラス。
+
+    Attributes:
+        max_slope_angle (float): 許容する最大面傾斜角[deg]。
+        max_curvature (float | None): 許容する局所曲率の絶対値の上限[1/mm]。
+            Noneの場合は判定しない。
+        max_inflection_points (int): 許容する変曲点の数。
+    """
+
+    max_slope_angle: float = 60.0
+    max_curvature: float | None = None
+    max_inflection_points: int = 0
+
+
+@dataclass
+class ScreeningResult:
+    """1面分のスクリーニング結果を保持するデータクラス。
+
+    Attributes:
+        design (str): 設計名。
+        surface (str): 面名。
+        max_slope_angle (float): 有効径内の最大面傾斜角[deg]（絶対値）。
+        max_slope_height (float): 最大面傾斜角となる高さ[mm]。
+        min_curvature (float): 有効径内の局所曲率（子午断面）の最小値[1/mm]。
+        max_curvature (float): 有効径内の局所曲率（子午断面）の最大値[1/mm]。
+        inflection_heights (list[float]): 変曲点の高さ[mm]。
+        violations (list[str]): 判定基準を満たさなかった項目。
+    """
+
+    design: str
+    surface: str
+    max_slope_angle: float
+    max_slope_height: float
+    min_curvature: float
+    max_curvature: float
+    inflection_heights: list[float] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+
+
+def _chunks(
+    surfaces: Iterable[ScreeningSurface], chunk_size: int
+) -> Iterator[list[ScreeningSurface]]:
+    iterator = iter(surfaces)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _inflection_heights(heights: np.ndarray, second: np.ndarray) -> list[float]:
+    """2階微分の符号変化から変曲点の高さを線形補間で求める。"""
+
+    # サグ計算不可（NaN）の点はゼロと同様に比較対象から除く
+    defined = np.where(np.isnan(second), 0.0, second)
+    sign = np.sign(np.where(np.abs(defined) < CURVATURE_EPSILON, 0.0, defined))
+    # ゼロの点を除いた並びで符号を比較し、ゼロを挟んだ符号変化も検出する
+    nonzero = np.flatnonzero(sign)
+    if nonzero.size < 2:
+        return []
+    changes = np.flatnonzero(sign[nonzero[1:]] != sign[nonzero[:-1]])
+
+    result = []
+    for k in changes:
+        i, j = nonzero[k], nonzero[k + 1]
+        h0, h1 = heights[i], heights[j]
+        d0, d1 = second[i], second[j]
+        result.append(float(h0 - d0 * (h1 - h0) / (d1 - d0)))
+    return result
+
+
+def _screen_chunk(
+    chunk: list[ScreeningSurface], limits: ScreeningLimits, steps: int
+) -> list[ScreeningResult]:
+    ratios = np.linspace(0.0, 1.0, steps + 1)
+    heights = np.array([float(s.diameter) / 2.0 for s in chunk])[:, np.newaxis] * ratios
+    first, second = calculate_sag_derivatives(
+        [s.radius for s in chunk], heights, [s.coefficients for s in chunk]
+    )
+
+    slope = np.degrees(np.arctan(np.abs(first)))
+    # 子午断面の曲率 κ = z'' / (1 + z'²)^(3/2)
+    curvature = second / (1.0 + first**2) ** 1.5
+    undefined = np.isnan(first).any(axis=1) | np.isnan(second).any(axis=1)
+
+    # NaNを含む面も集計できるよう、NaNを除いた値で極値を求める
+    slope_filled = np.where(np.isnan(slope), -np.inf, slope)
+    slope_index = np.argmax(slope_filled, axis=1)
+    curvature_min = np.min(np.where(np.isnan(curvature), np.inf, curvature), axis=1)
+    curvature_max = np.max(np.where(np.isnan(curvature), -np.inf, curvature), axis=1)
+
+    results = []
+    for i, surface in enumerate(chunk):
+        max_slope = float(slope_filled[i, slope_index[i]])
+        inflections = _inflection_heights(heights[i], second[i])
+        violations = []
+        if undefined[i]:
+            violations.append(VIOLATION_SAG_UNDEFINED)
+        if max_slope > limits.max_slope_angle:
+            violations.append(VIOLATION_SLOPE)
+        if limits.max_curvature is not None and (
+            max(abs(curvature_min[i]), abs(curvature_max[i])) > limits.max_curvature
+        ):
+            violations.append(VIOLATION_CURVATURE)
+        if len(inflections) > limits.max_inflection_points:
+            violations.append(VIOLATION_INFLECTION)
+
+        results.append(
+            ScreeningResult(
+                design=surface.design,
+                surface=surface.surface,
+                max_slope_angle=max_slope if math.isfinite(max_slope) else math.nan,
+                max_slope_height=float(heights[i, slope_index[i]]),
+                min_curvature=float(curvature_min[i]),
+                max_curvature=float(curvature_max[i]),
+                inflection_heights=inflections,
+                violations=violations,
+            )
+        )
+    return results
+
+
+def screen_surfaces(
+    surfaces: Iterable[ScreeningSurface],
+    limits: ScreeningLimits | None = None,
+    steps: int = SCREENING_STEPS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[ScreeningResult]:
+    """非球面の面傾斜角・局所曲率・変曲点を一括評価し、判定基準と照合する。
+
+    曲率半径と非球面係数から解析的に求めた1階・2階微分を、有効径内の
+    高密度な高さグリッド上で評価します。面は `chunk_size` 面ずつ配列演算するため、
+    入力がジェネレーターであればメモリ使用量は面数によらず一定です。
+
+    Args:
+        surfaces (Iterable[ScreeningSurface]): 評価する面。
+        limits (ScreeningLimits | None): 判定基準。省略時は既定値を使用する。
+        steps (int): 中心から有効径端までの分割数。
+        chunk_size (int): 1回の配列演算で評価する面数。
+
+    Returns:
+        list[ScreeningResult]: 面ごとの評価結果（入力順）。
+    """
+
+    if steps < 1:
+        raise ValueError("stepsは1以上である必要があります。")
+    if chunk_size < 1:
+        raise ValueError("chunk_sizeは1以上である必要があります。")
+    if limits is None:
+        limits = ScreeningLimits()
+
+    results: list[ScreeningResult] = []
+    for chunk in _chunks(surfaces, chunk_size):
+        results.extend(_screen_chunk(chunk, limits, steps))
+    return results
+
+
+def build_screening_report(
+    results: Iterable[ScreeningResult], violations_only: bool = False
+) -> pd.DataFrame:
+    """スクリーニング結果を重大度順に並べたレポートを作成する。
+
+    違反項目数の多い順、同数の場合は最大面傾斜角の大きい順に並べます。
+
+    Args:
+        results (Iterable[ScreeningResult]): スクリーニング結果。
+        violations_only (bool): Trueの場合は違反のある面のみを出力する。
+
+    Returns:
+        pd.DataFrame: 1行1面のレポート。rank列は1から始まる順位。
+    """
+
+    rows = [
+        {
+            "design": r.design,
+            "surface": r.surface,
+            "violation_count": len(r.violations),
+            "violations": ",".join(r.violations),
+            "max_slope_angle": r.max_slope_angle,
+            "max_slope_height": r.max_slope_height,
+            "min_curvature": r.min_curvature,
+            "max_curvature": r.max_curvature,
+            "inflection_count": len(r.inflection_heights),
+        }
+        for r in results
+        if r.violations or not violations_only
+    ]
+    columns = [
+        "design",
+        "surface",
+        "violation_count",
+        "violations",
+        "max_slope_angle",
+        "max_slope_height",
+        "min_curvature",
+        "max_curvature",
+        "inflection_count",
+    ]
+    report = pd.DataFrame(rows, columns=columns)
+    report = report.sort_values(
+        ["violation_count", "max_slope_angle"],
+        ascending=[False, False],
+        kind="stable",
+        na_position="first",
+    ).reset_index(drop=True)
+    report.insert(0, "rank", np.arange(1, len(report) + 1))
+    return report
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .calculations import AsphericCoefficients
+
+# CODE Vで無限大とみなす値（VBA版 clsOpticalData.Add と同じ閾値）
+INFINITY_THRESHOLD = 1e9
+SEQ_ENCODING = "cp932"
+
+# 非球面係数の記号と AsphericCoefficients のフィールドの対応
+_ASPHERIC_KEYS = {
+    "K": "conic",
+    "A": "a4",
+    "B": "a6",
+    "C": "a8",
+    "D": "a10",
+    "E": "a12",
+    "F": "a14",
+}
+_SURFACE_COMMANDS = ("S", "SO", "SI")
+
+
+@dataclass
+class SeqSurface:
+    """CODE Vシーケンスファイルの1面分のデータ。
+
+    Attributes:
+        name (str): 面名（物体面を"S0"とする連番）。
+        radius (float | None): 曲率半径[mm]。平面の場合はNone。
+        thickness (float | None): 次の面までの間隔[mm]。無限大の場合はNone。
+        glass (str | None): 硝材名（メーカー名を除く）。空気の場合はNone。
+        diameter (float | None): 有効径[mm]（CIRの2倍）。未指定の場合はNone。
+        coefficients (AsphericCoefficients | None): 非球面係数。球面の場合はNone。
+        is_stop (bool): 絞り面の場合にTrue。
+    """
+
+    name: str
+    radius: float | None
+    thickness: float | None
+    glass: str | None = None
+    diameter: float | None = None
+    coefficients: AsphericCoefficients | None = None
+    is_stop: bool = False
+
+
+@dataclass
+class SeqDesign:
+    """CODE Vシーケンスファイルから読み込んだ設計データ。
+
+    Attributes:
+        title (str): 設計名（TITLE行）。
+        surfaces (list[SeqSurface]): 物体面から像面までの面データ。
+    """
+
+    title: str = ""
+    surfaces: list[SeqSurface] = field(default_factory=list)
+
+
+def _parse_value(token: str) -> float | None:
+    value = float(token)
+    if abs(value) > INFINITY_THRESHOLD:
+        return None
+    return value
+
+
+def _logical_lines(text: str) -> list[str]:
+    """行末の"&"による継続行を連結した論理行の一覧を返す。"""
+
+    lines = []
+    pending = ""
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.endswith("&"):
+            pending += line[:-1].strip() + " "
+            continue
+        lines.append(pending + line)
+        pending = ""
+    if pending:
+        lines.append(pending.strip())
+    return lines
+
+
+def parse_seq(text: str) -> SeqDesign:
+    """CODE Vシーケンスファイルの内容を解析する。
+
+    VBA版 `clsOpticalData.Add` と同様に、面データ（S/SO/SI）、絞り（STO）、
+    有効半径（CIR）、非球面係数（ASP, K, A～F）を読み取ります。
+
+    Args:
+        text (str): シーケンスファイルの内容。
+
+    Returns:
+        SeqDesign: 解析した設計データ。
+
+    Raises:
+        ValueError: 面データの数値を解釈できない場合。
+    """
+
+    design = SeqDesign()
+    for line in _logical_lines(text):
+        if not line:
+            continue
+        tokens = line.split()
+        command = tokens[0].upper()
+
+        if command == "TITLE":
+            design.title = line[len(tokens[0]) :].strip().strip("'\"")
+        elif command in _SURFACE_COMMANDS:
+            if len(tokens) < 3:
+                raise ValueError(f"面データを解釈できません: {line}")
+            radius = _parse_value(tokens[1])
+            glass = None
+            if len(tokens) >= 4:
+                # "BK7_SCHOTT" → "BK7", "'NAME'" → "NAME"
+                glass = tokens[3].strip("'\"").upper().split("_")[0] or None
+            design.surfaces.append(
+                SeqSurface(
+                    name=f"S{len(design.surfaces)}",
+                    radius=None if radius == 0 else radius,
+                    thickness=_parse_value(tokens[2]),
+                    glass=glass,
+                )
+            )
+        elif not design.surfaces:
+            continue
+        elif command == "STO":
+            design.surfaces[-1].is_stop = True
+        elif command == "CIR" and len(tokens) >= 2:
+            try:
+                design.surfaces[-1].diameter = 2.0 * float(tokens[-1].rstrip(";"))
+            except ValueError:
+                continue
+        elif command == "ASP":
+            design.surfaces[-1].coefficients = AsphericCoefficients()
+        elif command in _ASPHERIC_KEYS:
+            coefficients = design.surfaces[-1].coefficients
+            if coefficients is None:
+                continue
+            # "A 1e-6; B -2e-9; C ..." のように複数係数が1行に並ぶ
+            for item in line.split(";"):
+                parts = item.split()
+                if len(parts) == 2 and parts[0].upper() in _ASPHERIC_KEYS:
+                    setattr(
+                        coefficients, _ASPHERIC_KEYS[parts[0].upper()], float(parts[1])
+                    )
+    return design
+
+
+def read_seq(path: str | Path, encoding: str = SEQ_ENCODING) -> SeqDesign:
+    """CODE Vシーケンスファイルを読み込む。
+
+    Args:
+        path (str | Path): シーケンスファイルのパス。
+        encoding (str): 文字コード。
+
+    Returns:
+        SeqDesign: 解析した設計データ。TITLE行がない場合はファイル名を設計名とする。
+    """
+
+    path = Path(path)
+    design = parse_seq(path.read_text(encoding=encoding, errors="replace"))
+    if not design.title:
+        design.title = path.stem
+    return design
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from ..defaults import DEFAULT_HOST, DEFAULT_PORT
+from .calculations import (
+    AsphericCoefficients,
+    _validate_number,
+    calculate_focal_length,
+    calculate_glass_weight,
+    calculate_sag,
+)
+
+logger = logging.getLogger(__name__)
+
+CALCULATE_PATH = "/calculate"
+HEALTH_PATH = "/health"
+# 1リクエストあたりの最大ボディサイズ[byte]
+MAX_BODY_SIZE = 16 * 1024 * 1024
+# サグ・重量計算キャッシュの最大保持数
+CACHE_SIZE = 65536
+# VBA UDFが不正入力時に返すエラー値
+VALUE_ERROR = "#VALUE!"
+
+_COEFFICIENT_FIELDS = ("conic", "a4", "a6", "a8", "a10", "a12", "a14")
+
+CoefficientKey = tuple[float, ...] | None
+
+
+def _coefficients_key(value: object) -> CoefficientKey:
+    """JSONの非球面係数をキャッシュ可能なタプルに変換する。"""
+
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise TypeError("coefficientsはオブジェクトである必要があります。")
+    unknown = set(value) - set(_COEFFICIENT_FIELDS)
+    if unknown:
+        raise ValueError(f"不明な非球面係数です: {sorted(unknown)}")
+    key = tuple(value.get(name, 0.0) for name in _COEFFICIENT_FIELDS)
+    for name, coefficient in zip(_COEFFICIENT_FIELDS, key):
+        _validate_number(coefficient, name)
+    return key
+
+
+def _coefficients_from_key(key: CoefficientKey) -> AsphericCoefficients | None:
+    if key is None:
+        return None
+    return AsphericCoefficients(*key)
+
+
+# typed=True: True と 1 のように等価な値でも型が異なれば別のキャッシュとし、
+# キャッシュの状態によって "#VALUE!" の判定が変わらないようにする
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def _cached_sag(
+    radius: float | None, diameter: float, coefficients: CoefficientKey
+) -> float | None:
+    return calculate_sag(radius, diameter, _coefficients_from_key(coefficients))
+
+
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def _cached_glass_weight(
+    radius1: float | None,
+    radius2: float | None,
+    thickness: float,
+    specific_gravity: float,
+    diameter1: float,
+    diameter2: float,
+    max_diameter: float,
+    coefficients1: CoefficientKey,
+    coefficients2: CoefficientKey,
+) -> float | None:
+    return calculate_glass_weight(
+        radius1,
+        radius2,
+        thickness,
+        specific_gravity,
+        diameter1,
+        diameter2,
+        max_diameter,
+        _coefficients_from_key(coefficients1),
+        _coefficients_from_key(coefficients2),
+    )
+
+
+def _sag(args: dict[str, Any]) -> float | None:
+    return _cached_sag(
+        args.get("radius"),
+        args["diameter"],
+        _coefficients_key(args.get("coefficients")),
+    )
+
+
+def _focal_length(args: dict[str, Any]) -> float | str:
+    return calculate_focal_length(
+        args.get("radius1"),
+        args.get("radius2"),
+        args.get("thickness"),
+        args.get("refractive_index"),
+    )
+
+
+def _glass_weight(args: dict[str, Any]) -> float | None:
+    return _cached_glass_weight(
+        args.get("radius1"),
+        args.get("radius2"),
+        args["thickness"],
+        args["specific_gravity"],
+        args["diameter1"],
+        args["diameter2"],
+        args["max_diameter"],
+        _coefficients_key(args.get("coefficients1")),
+        _coefficients_key(args.get("coefficients2")),
+    )
+
+
+def _cell_value(value: Any) -> Any:
+    """計算結果をJSONで表現できる値に変換する（NaNはNone、無限大は"Inf"）。"""
+
+    if isinstance(value, float) and not math.isfinite(value):
+        return None if math.isnan(value) else "Inf"
+    return value
+
+
+@dataclass
+class CalculationService:
+    """スプレッドシートからの一括計算リクエストを処理するサービス。
+
+    各セルの計算要求を関数名と引数の組として受け取り、VBA UDFと同じ
+    規約（計算不可はNone、無限大は"Inf"、不正入力は"#VALUE!"）で結果を返します。
+    サグ量と重量の計算結果はプロセス内でキャッシュされます。
+
+    Attributes:
+        functions (dict[str, Callable[[dict[str, Any]], Any]]): 関数名と処理の対応。
+    """
+
+    functions: dict[str, Callable[[dict[str, Any]], Any]] = field(
+        default_factory=lambda: {
+            "sag": _sag,
+            "focal_length": _focal_length,
+            "glass_weight": _glass_weight,
+        }
+    )
+
+    def evaluate(self, cell: object) -> Any:
+        """1セル分の計算要求を評価する。
+
+        Args:
+            cell (object): `{"function": 関数名, "args": {引数名: 値}}` 形式の要求。
+
+        Returns:
+            Any: 計算結果。計算不可（NaN）はNone、無限大は"Inf"、
+                不正な要求や数値のオーバーフローの場合は"#VALUE!"を返す。
+        """
+
+        try:
+            if not isinstance(cell, dict):
+                raise TypeError("計算要求はオブジェクトである必要があります。")
+            function = self.functions[cell["function"]]
+            args = cell.get("args", {})
+            if not isinstance(args, dict):
+                raise TypeError("argsはオブジェクトである必要があります。")
+            return _cell_value(function(args))
+        except (ArithmeticError, KeyError, TypeError, ValueError) as error:
+            logger.debug("計算要求を評価できません: %r (%s)", cell, error)
+            return VALUE_ERROR
+
+    def evaluate_batch(self, payload: object) -> dict[str, list[Any]]:
+        """複数セル分の計算要求をまとめて評価する。
+
+        Args:
+            payload (object): `{"requests": [計算要求, ...]}` 形式のリクエスト本文。
+
+        Returns:
+            dict[str, list[Any]]: `{"results": [計算結果, ...]}` 形式のレスポンス本文。
+                結果は要求と同じ順序で並ぶ。
+
+        Raises:
+            TypeError: リクエスト本文の形式が不正な場合。
+        """
+
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("requests"), list
+        ):
+            raise TypeError("requestsは配列である必要があります。")
+        return {"results": [self.evaluate(cell) for cell in payload["requests"]]}
+
+    @staticmethod
+    def cache_info() -> dict[str, int]:
+        """キャッシュの利用状況を返す。
+
+        Returns:
+            dict[str, int]: サグ・重量キャッシュのヒット数と保持数。
+        """
+
+        sag = _cached_sag.cache_info()
+        weight = _cached_glass_weight.cache_info()
+        return {
+            "sag_hits": sag.hits,
+            "sag_size": sag.currsize,
+            "glass_weight_hits": weight.hits,
+            "glass_weight_size": weight.currsize,
+        }
+
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, status: int, body: object, keep_alive: bool
+) -> None:
+    data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    headers = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(data)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    writer.write(headers.encode("ascii") + data)
+    await writer.drain()
+
+
+async def _handle_connection(
+    service: CalculationService,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """1接続分のHTTPリクエストを処理する（keep-alive対応）。"""
+
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            parts = request_line.decode("latin-1").split()
+            if len(parts) != 3:
+                await _write_response(
+                    writer, 400, {"error": "不正なリクエストです。"}, False
+                )
+                break
+            method, path, version = parts
+
+            headers: dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" and (
+                version == "HTTP/1.1" or connection == "keep-alive"
+            )
+
+            try:
+                length = int(headers.get("content-length", "0"))
+            except ValueError:
+                await _write_response(writer, 400, {"error": "不正な長さです。"}, False)
+                break
+            if length > MAX_BODY_SIZE:
+                await _write_response(
+                    writer, 413, {"error": "リクエストが大きすぎます。"}, False
+                )
+                break
+            body = await reader.readexactly(length) if length > 0 else b""
+
+            if path == HEALTH_PATH:
+                status, response = 200, {"status": "ok", **service.cache_info()}
+            elif path != CALCULATE_PATH:
+                status, response = 404, {"error": f"不明なパスです: {path}"}
+            elif method != "POST":
+                status, response = 405, {"error": "POSTのみ対応しています。"}
+            else:
+                try:
+                    status, response = 200, service.evaluate_batch(json.loads(body))
+                except (TypeError, ValueError) as error:
+                    status, response = 400, {"error": str(error)}
+
+            await _write_response(writer, status, response, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError) as error:
+        logger.debug("接続が切断されました: %s", error)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    service: CalculationService | None = None,
+) -> asyncio.Server:
+    """計算サーバーを起動する。
+
+    `POST /calculate` で一括計算要求を受け付け、`GET /health` で
+    稼働状況とキャッシュ状況を返します。
+
+    Args:
+        host (str): 待ち受けアドレス。既定はローカルホストのみ。
+        port (int): 待ち受けポート。0の場合は空きポートを自動選択する。
+        service (CalculationService | None): 使用するサービス。省略時は新規作成。
+
+    Returns:
+        asyncio.Server: 起動したサーバー。
+    """
+
+    if service is None:
+        service = CalculationService()
+
+    async def handler(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await _handle_connection(service, reader, writer)
+
+    server = await asyncio.start_server(handler, host, port)
+    for sock in server.sockets:
+        logger.info("計算サーバーを起動しました: %s", sock.getsockname())
+    return server
+
+
+async def serve_forever(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """計算サーバーを起動し、停止されるまで待ち受ける。
+
+    Args:
+        host (str): 待ち受けアドレス。
+        port (int): 待ち受けポート。
+    """
+
+    server = await start_server(host, port)
+    async with server:
+        await server.serve_forever()
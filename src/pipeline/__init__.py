@@ -0,0 +1,3 @@
+from .watch import WatchPipeline, WatchState, default_exporter
+
+__all__ = ["WatchPipeline", "WatchState", "default_exporter"]
@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from ..defaults import DEFAULT_CONCURRENCY, DEFAULT_INTERVAL, DEFAULT_QUEUE_SIZE
+from ..optics.export import _require_pyarrow, build_sag_table, write_table
+from ..optics.seq_file import SeqDesign, read_seq
+
+logger = logging.getLogger(__name__)
+
+SEQ_SUFFIX = ".seq"
+STATE_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+# 状態ファイルを書き出すまでに処理するファイル数の既定値
+STATE_SAVE_INTERVAL = 100
+
+STAGE_PARSE = "parse"
+STAGE_CALCULATE = "calculate"
+STAGE_EXPORT = "export"
+
+
+@dataclass
+class FileFingerprint:
+    """設計ファイルの変更検出用の指紋。
+
+    Attributes:
+        mtime_ns (int): 最終更新時刻[ns]。
+        size (int): ファイルサイズ[byte]。
+        sha256 (str): 内容のSHA-256ハッシュ。
+    """
+
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+def hash_file(path: Path) -> str:
+    """ファイル内容のSHA-256ハッシュを計算する。
+
+    Args:
+        path (Path): 対象ファイル。
+
+    Returns:
+        str: 16進表記のハッシュ値。
+    """
+
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        while chunk := stream.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class WatchState:
+    """処理済みファイルの指紋を保持し、状態ファイルに永続化する。
+
+    処理が完了したファイルのみを記録するため、途中でプロセスが停止しても
+    再起動後は未完了のファイルから処理を再開できます。
+
+    Attributes:
+        path (Path): 状態ファイルのパス。
+        files (dict[str, FileFingerprint]): 監視ルートからの相対パスと指紋の対応。
+    """
+
+    path: Path
+    files: dict[str, FileFingerprint] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | Path) -> WatchState:
+        """状態ファイルを読み込む。存在しない・壊れている場合は空の状態を返す。
+
+        Args:
+            path (str | Path): 状態ファイルのパス。
+
+        Returns:
+            WatchState: 読み込んだ状態。
+        """
+
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != STATE_VERSION:
+                raise ValueError(f"未対応の状態ファイルです: {data.get('version')}")
+            files = {
+                name: FileFingerprint(**value) for name, value in data["files"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning(
+                "状態ファイルを読み込めないため初期化します: %s (%s)", path, error
+            )
+            return cls(path)
+        return cls(path, files)
+
+    def serialize(self) -> str:
+        """現在の状態を状態ファイルの内容（JSON）に変換する。
+
+        Returns:
+            str: 状態ファイルに書き出す文字列。
+        """
+
+        data = {
+            "version": STATE_VERSION,
+            "files": {
+                name: asdict(value) for name, value in sorted(self.files.items())
+            },
+        }
+        return json.dumps(data, indent=2)
+
+    def write(self, text: str) -> None:
+        """`serialize()` の結果を一時ファイル経由で原子的に書き出す。
+
+        Args:
+            text (str): 状態ファイルの内容。
+        """
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(text, encoding="utf-8")
+        os.replace(temporary, self.path)
+
+    def save(self) -> None:
+        """状態ファイルを一時ファイル経由で原子的に書き出す。"""
+
+        self.write(self.serialize())
+
+
+@dataclass
+class StageMetrics:
+    """パイプラインの1段分の処理時間の統計。
+
+    Attributes:
+        count (int): 処理件数。
+        total_seconds (float): 合計処理時間[s]。
+        max_seconds (float): 最大処理時間[s]。
+    """
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """平均処理時間[s]を返す。"""
+
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def record(self, seconds: float) -> None:
+        """1件分の処理時間を記録する。
+
+        Args:
+            seconds (float): 処理時間[s]。
+        """
+
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+@dataclass
+class Job:
+    """パイプラインで処理する1ファイル分のジョブ。
+
+    Attributes:
+        relative_path (str): 監視ルートからの相対パス。
+        fingerprint (FileFingerprint): 検出時点の指紋。
+        changed (bool): 内容が変化した場合にTrue。Falseの場合は更新時刻のみの
+            変化で、処理せずに状態の記録だけを更新する。
+    """
+
+    relative_path: str
+    fingerprint: FileFingerprint
+    changed: bool = True
+
+
+def calculate_design(design: SeqDesign) -> dict[str, Any]:
+    """設計データからサグテーブルと面データの一覧を作成する。
+
+    有効径（CIR）が指定された曲面のみをサグテーブルの対象とします。
+
+    Args:
+        design (SeqDesign): 解析済みの設計データ。
+
+    Returns:
+        dict[str, Any]: "sag"（サグテーブル）と "surfaces"（面データ一覧）の
+            DataFrameを格納した辞書。
+    """
+
+    targets = [
+        s for s in design.surfaces if s.diameter is not None and s.radius is not None
+    ]
+    sag = build_sag_table(
+        [s.radius for s in targets],
+        [s.diameter for s in targets],
+        [s.coefficients for s in targets],
+        names=[s.name for s in targets],
+        design=design.title,
+    )
+    surfaces = pd.DataFrame(
+        {
+            "design": design.title,
+            "surface": [s.name for s in design.surfaces],
+            "radius": [s.radius for s in design.surfaces],
+            "thickness": [s.thickness for s in design.surfaces],
+            "glass": [s.glass for s in design.surfaces],
+            "diameter": [s.diameter for s in design.surfaces],
+            "aspheric": [s.coefficients is not None for s in design.surfaces],
+            "stop": [s.is_stop for s in design.surfaces],
+        }
+    )
+    return {"sag": sag, "surfaces": surfaces}
+
+
+def default_exporter(output_dir: Path) -> Callable[[str, dict[str, Any]], list[Path]]:
+    """計算結果をParquetファイルに書き出すエクスポーターを作成する。
+
+    Args:
+        output_dir (Path): 出力先ディレクトリ。
+
+    Returns:
+        Callable[[str, dict[str, Any]], list[Path]]: 相対パスと計算結果を受け取り、
+            `<出力先>/<相対パスの拡張子を除いた名前>.<種類>.parquet` に書き出す関数。
+
+    Raises:
+        ImportError: pyarrowがインストールされていない場合。
+    """
+
+    # 監視開始前に依存関係を確認し、全ファイルが毎回失敗し続けることを防ぐ
+    _require_pyarrow()
+
+    def export(relative_path: str, tables: dict[str, Any]) -> list[Path]:
+        base = output_dir / Path(relative_path).with_suffix("")
+        return [
+            write_table(table, base.with_name(f"{base.name}.{kind}.parquet"), kind=kind)
+            for kind, table in tables.items()
+        ]
+
+    return export
+
+
+@dataclass
+class WatchPipeline:
+    """監視ディレクトリの新規・変更設計ファイルのみを処理するパイプライン。
+
+    ファイルは更新時刻とサイズで一次判定し、変化がある場合のみ内容の
+    ハッシュを比較します。変更ファイルは上限付きのキューを経由して
+    解析→計算→出力の各段を並列数 `concurrency` で処理します。
+    走査は1ファイルずつキューに投入し、キューが満杯の間は走査（指紋の計算）も
+    待機するため、変更ファイル数によらず未処理ジョブとメモリ使用量は一定に抑えられます。
+    状態ファイルは `save_interval` 件の処理ごとと走査の終了時に書き出します。
+
+    Attributes:
+        source_dir (Path): 監視するディレクトリ。
+        state (WatchState): 処理済みファイルの状態。
+        exporter (Callable[[str, dict[str, Any]], list[Path]]): 出力段の処理。
+        concurrency (int): 同時に処理するジョブ数。
+        queue_size (int): キューに保持するジョブ数の上限。
+        save_interval (int): 状態ファイルを書き出すまでに処理するファイル数。
+            途中で停止した場合は最後の書き出し以降のファイルが再処理される。
+        parser (Callable[[Path], SeqDesign]): 解析段の処理。
+        calculator (Callable[[SeqDesign], dict[str, Any]]): 計算段の処理。
+        metrics (dict[str, StageMetrics]): 段ごとの処理時間の統計。
+    """
+
+    source_dir: Path
+    state: WatchState
+    exporter: Callable[[str, dict[str, Any]], list[Path]]
+    concurrency: int = DEFAULT_CONCURRENCY
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    save_interval: int = STATE_SAVE_INTERVAL
+    parser: Callable[[Path], SeqDesign] = read_seq
+    calculator: Callable[[SeqDesign], dict[str, Any]] = calculate_design
+    metrics: dict[str, StageMetrics] = field(
+        default_factory=lambda: {
+            STAGE_PARSE: StageMetrics(),
+            STAGE_CALCULATE: StageMetrics(),
+            STAGE_EXPORT: StageMetrics(),
+        }
+    )
+    _unsaved: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.concurrency < 1:
+            raise ValueError("concurrencyは1以上である必要があります。")
+        if self.queue_size < 1:
+            raise ValueError("queue_sizeは1以上である必要があります。")
+        if self.save_interval < 1:
+            raise ValueError("save_intervalは1以上である必要があります。")
+        self.source_dir = Path(self.source_dir)
+
+    def _detect(self, path: Path) -> Job | None:
+        """ファイルが新規または変更されていればジョブを返す。"""
+
+        relative = path.relative_to(self.source_dir).as_posix()
+        stat = path.stat()
+        recorded = self.state.files.get(relative)
+        if (
+            recorded is not None
+            and recorded.mtime_ns == stat.st_mtime_ns
+            and recorded.size == stat.st_size
+        ):
+            return None
+
+        fingerprint = FileFingerprint(stat.st_mtime_ns, stat.st_size, hash_file(path))
+        # 内容が同じで更新時刻のみ変わった場合は記録だけ更新する
+        changed = recorded is None or recorded.sha256 != fingerprint.sha256
+        return Job(relative, fingerprint, changed)
+
+    def scan(self, seen: set[str] | None = None) -> Iterator[Job]:
+        """監視ディレクトリを走査し、処理が必要なジョブを1件ずつ返す。
+
+        指紋の計算は次のジョブを要求された時点で行うため、呼び出し側が
+        消費を止めている間は走査も進みません。状態は変更しません。
+
+        Args:
+            seen (set[str] | None): 指定した場合は走査した設計ファイルの
+                相対パスを追加する。
+
+        Yields:
+            Job: 新規・変更ファイルのジョブ（相対パス順）。
+        """
+
+        for path in sorted(self.source_dir.rglob("*")):
+            if not path.is_file() or path.suffix.lower() != SEQ_SUFFIX:
+                continue
+            if seen is not None:
+                seen.add(path.relative_to(self.source_dir).as_posix())
+            try:
+                job = self._detect(path)
+            except OSError as error:
+                logger.warning("ファイルを確認できません: %s (%s)", path, error)
+                continue
+            if job is not None:
+                yield job
+
+    async def _timed(self, stage: str, function: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await asyncio.to_thread(function, *args)
+        finally:
+            self.metrics[stage].record(time.perf_counter() - start)
+
+    async def _process(self, job: Job) -> bool:
+        path = self.source_dir / job.relative_path
+        try:
+            design = await self._timed(STAGE_PARSE, self.parser, path)
+            tables = await self._timed(STAGE_CALCULATE, self.calculator, design)
+            await self._timed(STAGE_EXPORT, self.exporter, job.relative_path, tables)
+        except Exception:
+            # 1ファイルの失敗でデーモン全体を止めない（状態は更新せず次回再試行）
+            logger.exception("設計ファイルの処理に失敗しました: %s", job.relative_path)
+            return False
+
+        self._record(job)
+        logger.info("設計ファイルを処理しました: %s", job.relative_path)
+        return True
+
+    def _record(self, job: Job) -> None:
+        self.state.files[job.relative_path] = job.fingerprint
+        self._unsaved += 1
+
+    async def _save_state(self, lock: asyncio.Lock) -> None:
+        """状態をイベントループ上で直列化し、書き出しは別スレッドで行う。"""
+
+        async with lock:
+            text = self.state.serialize()
+            self._unsaved = 0
+            await asyncio.to_thread(self.state.write, text)
+
+    async def _worker(
+        self, queue: asyncio.Queue[Job | None], done: list[str], lock: asyncio.Lock
+    ) -> None:
+        while (job := await queue.get()) is not None:
+            try:
+                if await self._process(job):
+                    done.append(job.relative_path)
+                    if self._unsaved >= self.save_interval:
+                        await self._save_state(lock)
+            finally:
+                queue.task_done()
+        queue.task_done()
+
+    async def run_once(self) -> list[str]:
+        """監視ディレクトリを1回走査し、変更ファイルをすべて処理する。
+
+        Returns:
+            list[str]: 処理に成功したファイルの相対パス。
+        """
+
+        queue: asyncio.Queue[Job | None] = asyncio.Queue(maxsize=self.queue_size)
+        lock = asyncio.Lock()
+        done: list[str] = []
+        seen: set[str] = set()
+        workers = [
+            asyncio.create_task(self._worker(queue, done, lock))
+            for _ in range(self.concurrency)
+        ]
+        try:
+            jobs = self.scan(seen)
+            # 指紋の計算は1件ずつ別スレッドで行い、キューが満杯の間は
+            # 次のファイルの走査に進まない（バックプレッシャー）
+            while (job := await asyncio.to_thread(next, jobs, None)) is not None:
+                if job.changed:
+                    await queue.put(job)
+                else:
+                    self._record(job)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        # 削除された設計ファイルの記録を除く
+        for name in self.state.files.keys() - seen:
+            del self.state.files[name]
+            self._unsaved += 1
+        if self._unsaved:
+            await self._save_state(lock)
+        return done
+
+    def log_metrics(self) -> None:
+        """段ごとの処理時間の統計をログに出力する。"""
+
+        for stage, metrics in self.metrics.items():
+            logger.info(
+                "%s: 件数=%d 平均=%.3fs 最大=%.3fs",
+                stage,
+                metrics.count,
+                metrics.mean_seconds,
+                metrics.max_seconds,
+            )
+
+    async def run_forever(self, interval: float = DEFAULT_INTERVAL) -> None:
+        """一定間隔で監視ディレクトリをポーリングし続ける。
+
+        Args:
+            interval (float): ポーリング間隔[s]。
+        """
+
+        while True:
+            if await self.run_once():
+                self.log_metrics()
+            await asyncio.sleep(interval)
@@ -0,0 +1,142 @@
+import random
+import time
+
+import pytest
+
+from src.drawing.layout import (
+    Annotation,
+    Box,
+    Placement,
+    UniformGrid,
+    layout_annotations,
+)
+
+
+def _synthetic_assembly(
+    element_count: int, seed: int = 0
+) -> tuple[list[Annotation], list[Box]]:
+    """エレメントを光軸方向に並べた合成アセンブリの注記と外形を作成する。"""
+    rng = random.Random(seed)
+    annotations = []
+    obstacles = []
+    x = 0.0
+    for i in range(element_count):
+        thickness = rng.uniform(2.0, 8.0)
+        radius = rng.uniform(5.0, 30.0)
+        center = x + thickness / 2.0
+        obstacles.append(Box(x, -radius, x + thickness, radius))
+        annotations.extend(
+            [
+                Annotation(f"L{i}", center, radius, 6.0, 3.5, priority=1),
+                Annotation(f"L{i}-tol", center, radius, 18.0, 5.0),
+                Annotation(
+                    f"L{i}-t", center, -radius, 10.0, 3.5, placement=Placement.BELOW
+                ),
+            ]
+        )
+        x += thickness + rng.uniform(0.5, 3.0)
+    return annotations, obstacles
+
+
+def _assert_no_overlap(boxes: list[Box], obstacles: list[Box], gap: float) -> None:
+    """総当たりで注記同士・注記と外形の重なりがないことを検証する。"""
+    for i, box in enumerate(boxes):
+        for other in boxes[i + 1 :] + obstacles:
+            assert not box.intersects(other, gap - 1e-9)
+
+
+def test_box_intersects_with_gap() -> None:
+    """隙間を考慮した矩形の重なり判定を検証する。"""
+    a = Box(0.0, 0.0, 10.0, 5.0)
+    b = Box(10.5, 0.0, 20.0, 5.0)
+    assert not a.intersects(b)
+    assert a.intersects(b, gap=1.0)
+    assert a.intersects(Box(5.0, 2.0, 6.0, 3.0))
+
+
+def test_box_rejects_inverted_coordinates() -> None:
+    """最小座標が最大座標を超える矩形でValueErrorとなることを検証する。"""
+    with pytest.raises(ValueError, match="最小座標"):
+        Box(1.0, 0.0, 0.0, 1.0)
+
+
+def test_uniform_grid_detects_collision_across_cells() -> None:
+    """複数セルにまたがる矩形の重なりを検出できることを検証する。"""
+    grid = UniformGrid(cell_size=2.0)
+    grid.insert(Box(0.0, 0.0, 9.0, 1.0))
+    assert grid.collides(Box(7.5, 0.5, 8.0, 3.0))
+    assert not grid.collides(Box(7.5, 1.5, 8.0, 3.0))
+    assert grid.collides(Box(7.5, 1.5, 8.0, 3.0), gap=1.0)
+    assert not grid.collides(Box(-20.0, -20.0, -10.0, -10.0))
+
+
+def test_layout_keeps_isolated_annotation_at_anchor() -> None:
+    """干渉のない注記は基準点に最も近い段に配置されることを検証する。"""
+    placed = layout_annotations(
+        [Annotation("L1", 10.0, 5.0, 4.0, 2.0)], obstacles=[Box(8.0, -5.0, 12.0, 5.0)]
+    )
+    assert placed[0].tier == 0
+    assert not placed[0].overlapped
+    assert placed[0].box == Box(8.0, 6.0, 12.0, 8.0)
+
+
+def test_layout_stacks_conflicting_annotations_by_priority() -> None:
+    """重なる注記は優先度の低いものが外側の段へ移動することを検証する。"""
+    annotations = [
+        Annotation("tol", 10.0, 0.0, 10.0, 2.0),
+        Annotation("name", 11.0, 0.0, 4.0, 2.0, priority=1),
+    ]
+    placed = layout_annotations(annotations, gap=0.5)
+    assert [p.name for p in placed] == ["tol", "name"]
+    assert placed[1].tier == 0
+    assert placed[0].tier == 1
+    assert placed[0].box.y_min == pytest.approx(3.0)
+
+
+def test_layout_places_below_annotations_downward() -> None:
+    """下側配置の注記が基準点より下に積まれることを検証する。"""
+    annotations = [
+        Annotation("a", 0.0, 0.0, 4.0, 2.0, placement=Placement.BELOW),
+        Annotation("b", 1.0, 0.0, 4.0, 2.0, placement=Placement.BELOW),
+    ]
+    placed = layout_annotations(annotations, gap=1.0)
+    assert placed[0].box.y_max == pytest.approx(-1.0)
+    assert placed[1].box.y_max == pytest.approx(-4.0)
+
+
+def test_layout_reports_unresolved_overlap() -> None:
+    """最大段数で解消できない重なりを報告することを検証する。"""
+    annotations = [Annotation(f"A{i}", 0.0, 0.0, 4.0, 2.0) for i in range(3)]
+    placed = layout_annotations(annotations, max_tiers=2)
+    assert [p.overlapped for p in placed] == [False, False, True]
+
+
+def test_layout_rejects_invalid_max_tiers() -> None:
+    """max_tiersが1未満の場合にValueErrorとなることを検証する。"""
+    with pytest.raises(ValueError, match="max_tiers"):
+        layout_annotations([Annotation("A", 0.0, 0.0, 1.0, 1.0)], max_tiers=0)
+
+
+def test_layout_synthetic_assembly_has_no_overlap() -> None:
+    """合成アセンブリで注記同士・注記と外形が重ならないことを検証する。"""
+    annotations, obstacles = _synthetic_assembly(120)
+    placed = layout_annotations(annotations, obstacles=obstacles, gap=1.0)
+
+    assert [p.name for p in placed] == [a.name for a in annotations]
+    assert not any(p.overlapped for p in placed)
+    _assert_no_overlap([p.box for p in placed], obstacles, gap=1.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("element_count", [100, 1000])
+def test_layout_benchmark_synthetic_assembly(element_count: int) -> None:
+    """100エレメント以上の合成アセンブリを実用的な時間で配置できることを検証する。"""
+    annotations, obstacles = _synthetic_assembly(element_count, seed=1)
+
+    start = time.perf_counter()
+    placed = layout_annotations(annotations, obstacles=obstacles)
+    elapsed = time.perf_counter() - start
+
+    assert len(placed) == 3 * element_count
+    assert not any(p.overlapped for p in placed)
+    assert elapsed < 1.0
@@ -0,0 +1,213 @@
+import pytest
+
+from src.optics.calculations import (
+    AsphericCoefficients,
+    calculate_glass_weight,
+    calculate_sag,
+)
+from src.optics.cemented import (
+    VIOLATION_CEMENT_GAP,
+    VIOLATION_DIAMETER,
+    VIOLATION_EDGE_STEP,
+    CementedLens,
+    CementedLimits,
+    CementedSurface,
+    calculate_cemented_lens,
+    calculate_cemented_lenses,
+)
+
+
+@pytest.fixture
+def doublet() -> CementedLens:
+    """凸レンズと凹メニスカスを接合したダブレット。"""
+    return CementedLens(
+        surfaces=[
+            CementedSurface(50.0, 30.0, AsphericCoefficients(conic=-0.5, a4=1e-6)),
+            CementedSurface(-40.0, 28.0),
+            CementedSurface(-200.0, 28.0),
+        ],
+        thicknesses=[6.0, 2.0],
+        specific_gravities=[2.5, 3.6],
+        max_diameters=[32.0, 30.0],
+    )
+
+
+@pytest.fixture
+def triplet() -> CementedLens:
+    """平面を含むトリプレット。"""
+    return CementedLens(
+        surfaces=[
+            CementedSurface(None, 20.0),
+            CementedSurface(30.0, 20.0),
+            CementedSurface(-30.0, 20.0),
+            CementedSurface(None, 20.0),
+        ],
+        thicknesses=[2.0, 8.0, 2.0],
+        specific_gravities=[3.0, 2.5, 3.0],
+        max_diameters=[22.0, 22.0, 22.0],
+    )
+
+
+def test_element_weights_match_calculate_glass_weight(doublet: CementedLens) -> None:
+    """各エレメントの重量が `calculate_glass_weight()` と一致することを検証する。"""
+    result = calculate_cemented_lens(doublet)
+    assert result is not None
+
+    for element, weight in zip(doublet.to_elements(), result.element_weights):
+        expected = calculate_glass_weight(
+            radius1=element.radius1,
+            radius2=element.radius2,
+            thickness=element.thickness,
+            specific_gravity=element.specific_gravity,
+            diameter1=element.diameter1,
+            diameter2=element.diameter2,
+            max_diameter=element.max_diameter,
+            coefficients1=element.coefficients1,
+            coefficients2=element.coefficients2,
+        )
+        assert weight == pytest.approx(expected, rel=1e-12)
+    assert result.total_weight == pytest.approx(sum(result.element_weights))
+
+
+def test_edge_thickness_and_interface_checks(doublet: CementedLens) -> None:
+    """コバ厚と接合面の外径段差が計算されることを検証する。"""
+    result = calculate_cemented_lens(doublet)
+    assert result is not None
+
+    # 平凸部のコバ厚 = 中心厚 + R2面端サグ - R1面端サグ
+    assert result.edge_thicknesses[0] < 6.0
+    assert result.edge_thicknesses[1] > 2.0
+    assert len(result.interfaces) == 1
+    interface = result.interfaces[0]
+    assert interface.surface_index == 1
+    assert interface.edge_step == pytest.approx(1.0)
+    assert interface.is_valid
+    assert result.is_valid
+
+
+def test_interface_diameter_exceeding_max_diameter_is_invalid() -> None:
+    """接合面の有効径が外径を超える場合にチェックが失敗することを検証する。"""
+    lens = CementedLens(
+        surfaces=[
+            CementedSurface(40.0, 20.0),
+            CementedSurface(-40.0, 24.0),
+            CementedSurface(None, 20.0),
+        ],
+        thicknesses=[6.0, 2.0],
+        specific_gravities=[2.5, 3.6],
+        max_diameters=[26.0, 22.0],
+    )
+    result = calculate_cemented_lens(lens)
+    assert result is not None
+    assert result.interfaces[0].violations == [VIOLATION_DIAMETER]
+    assert not result.interfaces[0].is_valid
+    assert not result.is_valid
+
+
+def _mismatched_doublet(mating_radius: float) -> CementedLens:
+    """後側エレメントの接合面の曲率半径が前側と異なるダブレット。"""
+    return CementedLens(
+        surfaces=[
+            CementedSurface(50.0, 30.0),
+            CementedSurface(-40.0, 28.0, mating=CementedSurface(mating_radius, 26.0)),
+            CementedSurface(-200.0, 28.0),
+        ],
+        thicknesses=[6.0, 2.0],
+        specific_gravities=[2.5, 3.6],
+        max_diameters=[32.0, 30.0],
+    )
+
+
+def test_cement_gap_from_mismatched_interface() -> None:
+    """前後の接合面形状の差から隙間を求め、判定基準と照合することを検証する。"""
+    lens = _mismatched_doublet(-40.4)
+    result = calculate_cemented_lens(lens)
+    assert result is not None
+
+    # 共通の有効径（φ26）端でのサグ差が隙間となる
+    expected = calculate_sag(-40.4, 26.0) - calculate_sag(-40.0, 26.0)
+    interface = result.interfaces[0]
+    assert interface.cement_gap == pytest.approx(abs(expected), rel=1e-12)
+    assert interface.violations == [VIOLATION_CEMENT_GAP]
+    assert not result.is_valid
+
+    relaxed = calculate_cemented_lens(lens, CementedLimits(max_cement_gap=0.1))
+    assert relaxed is not None
+    assert relaxed.is_valid
+
+
+def test_mismatched_interface_weights_match_calculate_glass_weight() -> None:
+    """後側の接合面形状を指定した場合も重量が単レンズ計算と一致することを検証する。"""
+    lens = _mismatched_doublet(-40.4)
+    result = calculate_cemented_lens(lens)
+    assert result is not None
+    rear = lens.to_elements()[1]
+    assert rear.radius1 == -40.4
+    assert rear.diameter1 == 26.0
+    expected = calculate_glass_weight(
+        rear.radius1, rear.radius2, 2.0, 3.6, 26.0, 28.0, 30.0
+    )
+    assert result.element_weights[1] == pytest.approx(expected, rel=1e-12)
+
+
+def test_edge_step_limit(doublet: CementedLens) -> None:
+    """外径段差の上限を指定した場合に段差が判定されることを検証する。"""
+    result = calculate_cemented_lens(doublet, CementedLimits(max_edge_step=0.5))
+    assert result is not None
+    assert result.interfaces[0].cement_gap == 0.0
+    assert result.interfaces[0].violations == [VIOLATION_EDGE_STEP]
+
+
+def test_batch_over_multiple_groups(
+    doublet: CementedLens, triplet: CementedLens
+) -> None:
+    """複数の接合群の一括計算が個別計算と一致することを検証する。"""
+    batch = calculate_cemented_lenses([doublet, triplet])
+    assert batch == [calculate_cemented_lens(doublet), calculate_cemented_lens(triplet)]
+    assert batch[1] is not None
+    assert len(batch[1].element_weights) == 3
+    assert len(batch[1].interfaces) == 2
+
+
+def test_returns_none_when_sag_invalid(doublet: CementedLens) -> None:
+    """サグ計算に失敗した接合群のみNoneとなることを検証する（異常系）。"""
+    invalid = CementedLens(
+        surfaces=[
+            CementedSurface(5.0, 25.0, AsphericCoefficients(conic=10.0)),
+            CementedSurface(-40.0, 20.0),
+            CementedSurface(None, 20.0),
+        ],
+        thicknesses=[6.0, 2.0],
+        specific_gravities=[2.5, 3.6],
+        max_diameters=[26.0, 26.0],
+    )
+    results = calculate_cemented_lenses([invalid, doublet])
+    assert results[0] is None
+    assert results[1] is not None
+
+
+def test_batch_empty() -> None:
+    """空の入力では空リストを返すことを検証する。"""
+    assert calculate_cemented_lenses([]) == []
+
+
+def test_cemented_lens_validates_surface_count() -> None:
+    """面数がエレメント数+1でない場合にValueErrorを送出することを検証する。"""
+    with pytest.raises(ValueError):
+        CementedLens(
+            surfaces=[CementedSurface(50.0, 20.0), CementedSurface(-50.0, 20.0)],
+            thicknesses=[5.0, 2.0],
+            specific_gravities=[2.5, 3.6],
+            max_diameters=[22.0, 22.0],
+        )
+
+
+def test_cemented_lens_requires_two_elements() -> None:
+    """エレメントが1枚の場合にValueErrorを送出することを検証する。"""
+    with pytest.raises(ValueError):
+        CementedLens(
+            surfaces=[CementedSurface(50.0, 20.0), CementedSurface(-50.0, 20.0)],
+            thicknesses=[5.0],
+            specific_gravities=[2.5],
+            max_diameters=[22.0],
+        )
@@ -0,0 +1,150 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.optics.calculations import LensElement, calculate_focal_length
+from src.optics.dispersion import (
+    WAVELENGTH_C,
+    WAVELENGTH_D,
+    WAVELENGTH_F,
+    SchottCoefficients,
+    SellmeierCoefficients,
+    calculate_chromatic_focal_lengths,
+    calculate_focal_lengths,
+    calculate_longitudinal_chromatic_shift,
+    calculate_refractive_indices,
+)
+
+# N-BK7（Schottカタログ値）
+N_BK7 = SellmeierCoefficients(
+    b1=1.03961212,
+    b2=0.231792344,
+    b3=1.01046945,
+    c1=0.00600069867,
+    c2=0.0200179144,
+    c3=103.560653,
+)
+# BK7（Schott旧カタログの分散式）
+BK7_SCHOTT = SchottCoefficients(
+    a0=2.2718929,
+    a1=-1.0108077e-2,
+    a2=1.0592509e-2,
+    a3=2.0816965e-4,
+    a4=-7.6472538e-6,
+    a5=4.9240991e-7,
+)
+
+
+@pytest.fixture
+def elements() -> list[LensElement]:
+    """両凸レンズと平凸レンズ。"""
+    return [
+        LensElement(100.0, -100.0, 5.0, 2.51, 30.0, 30.0, 30.0),
+        LensElement(50.0, None, 3.0, 2.51, 20.0, 20.0, 20.0),
+    ]
+
+
+def test_refractive_indices_match_catalog() -> None:
+    """N-BK7のC・d・F線の屈折率がカタログ値と一致することを検証する。"""
+    indices = calculate_refractive_indices(
+        [N_BK7, BK7_SCHOTT], [WAVELENGTH_C, WAVELENGTH_D, WAVELENGTH_F]
+    )
+    assert indices.shape == (2, 3)
+    expected = [1.51432, 1.51680, 1.52238]
+    assert indices[0] == pytest.approx(expected, abs=2e-5)
+    assert indices[1] == pytest.approx(expected, abs=2e-5)
+
+
+def test_refractive_indices_reject_unknown_type() -> None:
+    """分散式係数以外を渡した場合にTypeErrorを送出することを検証する。"""
+    with pytest.raises(TypeError):
+        calculate_refractive_indices([1.5], [WAVELENGTH_D])  # type: ignore[list-item]
+
+
+@pytest.mark.parametrize(
+    "radius1,radius2,thickness,refractive_index",
+    [
+        (100.0, -100.0, 5.0, 1.5168),
+        (-100.0, 100.0, 5.0, 1.5168),
+        (50.0, None, 3.0, 1.5),
+        (None, None, 3.0, 1.5),
+        (50.0, -50.0, 5.0, 1.0),
+        (50.0, -50.0, 5.0, 0.5),
+    ],
+)
+def test_focal_lengths_match_scalar_function(
+    radius1: float | None,
+    radius2: float | None,
+    thickness: float,
+    refractive_index: float,
+) -> None:
+    """配列版の焦点距離が `calculate_focal_length()` と一致することを検証する。"""
+    result = calculate_focal_lengths(
+        np.array(math.nan if radius1 is None else radius1),
+        np.array(math.nan if radius2 is None else radius2),
+        np.array(thickness),
+        np.array(refractive_index),
+    )
+    expected = calculate_focal_length(radius1, radius2, thickness, refractive_index)
+    if expected == "Inf":
+        assert np.isinf(result)
+    else:
+        assert float(result) == pytest.approx(expected, rel=1e-12)
+
+
+def test_chromatic_focal_lengths_broadcast(elements: list[LensElement]) -> None:
+    """エレメント×波長の焦点距離が個別計算と一致することを検証する。"""
+    wavelengths = [WAVELENGTH_C, WAVELENGTH_D, WAVELENGTH_F]
+    focal = calculate_chromatic_focal_lengths(elements, [N_BK7, N_BK7], wavelengths)
+    indices = calculate_refractive_indices([N_BK7], wavelengths)[0]
+
+    assert focal.shape == (2, 3)
+    for i, element in enumerate(elements):
+        for j, n in enumerate(indices):
+            expected = calculate_focal_length(
+                element.radius1, element.radius2, element.thickness, float(n)
+            )
+            assert focal[i, j] == pytest.approx(expected, rel=1e-12)
+
+
+def test_longitudinal_chromatic_shift(elements: list[LensElement]) -> None:
+    """正レンズでF線の焦点がC線より短くなり、基準波長では0となることを検証する。"""
+    shift = calculate_longitudinal_chromatic_shift(
+        elements, [N_BK7, N_BK7], [WAVELENGTH_C, WAVELENGTH_D, WAVELENGTH_F]
+    )
+    assert shift.shape == (2, 3)
+    assert shift[:, 1] == pytest.approx([0.0, 0.0], abs=1e-12)
+    assert (shift[:, 0] > 0).all()
+    assert (shift[:, 2] < 0).all()
+
+
+def test_longitudinal_chromatic_shift_is_nan_for_afocal() -> None:
+    """焦点距離が無限大のエレメントではNaNとなることを検証する。"""
+    plate = LensElement(None, None, 5.0, 2.51, 20.0, 20.0, 20.0)
+    shift = calculate_longitudinal_chromatic_shift([plate], [N_BK7], [WAVELENGTH_F])
+    assert np.isnan(shift).all()
+
+
+def test_undefined_index_is_not_afocal(elements: list[LensElement]) -> None:
+    """屈折率が求まらない波長の焦点距離が無限大ではなくNaNとなることを検証する。"""
+    wavelengths = [77.46, 0.0, -10.0, WAVELENGTH_D]
+    indices = calculate_refractive_indices([N_BK7], wavelengths)[0]
+    assert np.isnan(indices[:3]).all()
+
+    focal = calculate_chromatic_focal_lengths(elements, [N_BK7, N_BK7], wavelengths)
+    assert np.isnan(focal[:, :3]).all()
+    assert np.isfinite(focal[:, 3]).all()
+
+    shift = calculate_longitudinal_chromatic_shift(
+        elements, [N_BK7, N_BK7], wavelengths[:3]
+    )
+    assert np.isnan(shift).all()
+
+
+def test_chromatic_focal_lengths_require_matching_glasses(
+    elements: list[LensElement],
+) -> None:
+    """elementsとglassesの要素数が異なる場合にValueErrorを送出することを検証する。"""
+    with pytest.raises(ValueError):
+        calculate_chromatic_focal_lengths(elements, [N_BK7], [WAVELENGTH_D])
@@ -0,0 +1,156 @@
+import math
+
+import pandas as pd
+import pytest
+
+from src.optics.calculations import AsphericCoefficients, LensElement, calculate_sag
+from src.optics.export import (
+    SCHEMA_VERSION,
+    build_lens_table,
+    build_sag_table,
+    build_summary_table,
+    read_arrow_table,
+    read_table,
+    write_table,
+)
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def elements() -> list[LensElement]:
+    """非球面エレメントと平行平板。"""
+    return [
+        LensElement(
+            radius1=50.0,
+            radius2=-50.0,
+            thickness=5.0,
+            specific_gravity=2.5,
+            diameter1=40.0,
+            diameter2=40.0,
+            max_diameter=40.0,
+            coefficients1=AsphericCoefficients(conic=-0.5, a4=1e-6),
+        ),
+        LensElement(None, None, 5.0, 2.5, 40.0, 40.0, 40.0),
+    ]
+
+
+def test_build_lens_table(elements: list[LensElement]) -> None:
+    """レンズテーブルに形状・非球面係数・質量が展開されることを検証する。"""
+    table = build_lens_table(elements, design="ZOOM-001")
+    assert list(table["element"]) == ["G01", "G02"]
+    assert (table["design"] == "ZOOM-001").all()
+    assert table.loc[0, "conic_1"] == -0.5
+    assert table.loc[0, "a4_1"] == 1e-6
+    assert math.isnan(table.loc[1, "radius1"])
+    assert table.loc[1, "mass"] == pytest.approx(2.5 * math.pi * 400.0 * 5.0 / 1000.0)
+
+
+def test_build_sag_table_matches_calculate_sag() -> None:
+    """サグテーブルの値が `calculate_sag()` と一致することを検証する。"""
+    coefficients = AsphericCoefficients(conic=-0.5, a4=1e-6)
+    table = build_sag_table(
+        [50.0, None], [20.0, 30.0], [coefficients, None], names=["R1", "R2"], steps=10
+    )
+    assert len(table) == 22
+    edge = table[(table["surface"] == "R1")].iloc[-1]
+    assert edge["height"] == pytest.approx(10.0)
+    assert edge["sag"] == pytest.approx(calculate_sag(50.0, 20.0, coefficients))
+    assert (table[table["surface"] == "R2"]["sag"] == 0.0).all()
+
+
+def test_build_sag_table_marks_invalid_points_as_nan() -> None:
+    """サグ計算不可の点が欠損値となることを検証する（異常系）。"""
+    table = build_sag_table([10.0], [100.0])
+    assert table["sag"].isna().any()
+    assert table["sag"].iloc[0] == 0.0
+
+
+def test_build_summary_table(elements: list[LensElement]) -> None:
+    """設計ごとにエレメント数・質量・サグ量が集計されることを検証する。"""
+    lens_table = pd.concat(
+        [
+            build_lens_table(elements, design="A"),
+            build_lens_table(elements[:1], design="B"),
+        ],
+        ignore_index=True,
+    )
+    sag_table = pd.concat(
+        [
+            build_sag_table([50.0, -50.0, 10.0], [40.0, 40.0, 30.0], design="A"),
+            build_sag_table([50.0], [40.0], design="B"),
+        ],
+        ignore_index=True,
+    )
+    summary = build_summary_table(lens_table, sag_table)
+
+    assert list(summary["design"]) == ["A", "B"]
+    assert list(summary["element_count"]) == [2, 1]
+    assert summary.loc[0, "total_mass"] == pytest.approx(lens_table["mass"][:2].sum())
+    assert summary.loc[0, "total_thickness"] == pytest.approx(10.0)
+    assert list(summary["surface_count"]) == [3, 1]
+    assert summary.loc[1, "max_abs_sag"] == pytest.approx(calculate_sag(50.0, 40.0))
+    assert summary.loc[0, "undefined_sag_count"] > 0
+    assert summary.loc[1, "undefined_sag_count"] == 0
+
+
+def test_build_summary_table_propagates_missing_mass() -> None:
+    """質量を計算できないエレメントを含む設計の合計質量が欠損値となることを検証する。"""
+    invalid = LensElement(5.0, -5.0, 1.0, 2.5, 40.0, 40.0, 40.0)
+    summary = build_summary_table(build_lens_table([invalid], design="X"))
+    assert math.isnan(summary.loc[0, "total_mass"])
+    assert "surface_count" not in summary.columns
+
+
+def test_build_summary_table_requires_design(elements: list[LensElement]) -> None:
+    """design列のないテーブルでValueErrorとなることを検証する（異常系）。"""
+    with pytest.raises(ValueError, match="design"):
+        build_summary_table(build_lens_table(elements))
+
+
+@pytest.mark.parametrize(
+    "filename,compression",
+    [
+        ("lens.parquet", "zstd"),
+        ("lens.feather", "lz4"),
+        ("lens.arrow", None),
+    ],
+)
+def test_round_trip(
+    tmp_path, elements: list[LensElement], filename: str, compression: str | None
+) -> None:
+    """書き出したテーブルがスキーマバージョン付きで読み戻せることを検証する。"""
+    table = build_lens_table(elements)
+    path = write_table(table, tmp_path / filename, kind="lens", compression=compression)
+
+    loaded, metadata = read_table(path)
+    assert metadata.schema_version == SCHEMA_VERSION
+    assert metadata.kind == "lens"
+    assert loaded.equals(table)
+
+
+def test_read_selected_columns(tmp_path) -> None:
+    """指定した列のみを読み込めることを検証する。"""
+    table = build_sag_table([50.0, -40.0], [20.0, 20.0])
+    path = write_table(table, tmp_path / "sag.feather", kind="sag", compression=None)
+
+    arrow_table, metadata = read_arrow_table(path, columns=["sag"])
+    assert metadata.kind == "sag"
+    assert arrow_table.column_names == ["sag"]
+    assert arrow_table.num_rows == len(table)
+
+
+def test_read_rejects_file_without_schema_version(tmp_path) -> None:
+    """スキーマバージョンのないファイルでValueErrorを送出することを検証する。"""
+    table = build_sag_table([50.0], [20.0])
+    path = tmp_path / "plain.parquet"
+    table.to_parquet(path)
+    with pytest.raises(ValueError, match="スキーマバージョン"):
+        read_table(path)
+
+
+def test_write_rejects_unknown_suffix(tmp_path) -> None:
+    """拡張子から形式を判定できない場合にValueErrorを送出することを検証する。"""
+    table = build_sag_table([50.0], [20.0])
+    with pytest.raises(ValueError):
+        write_table(table, tmp_path / "sag.xlsx", kind="sag")
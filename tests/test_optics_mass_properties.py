@@ -0,0 +1,188 @@
+import math
+
+import pytest
+
+from src.optics.calculations import (
+    AsphericCoefficients,
+    LensElement,
+    calculate_glass_weight,
+)
+from src.optics.mass_properties import (
+    MassProperties,
+    calculate_assembly_mass_properties,
+    calculate_mass_properties,
+    calculate_mass_properties_batch,
+    combine_mass_properties,
+)
+
+
+@pytest.fixture
+def aspheric_element() -> LensElement:
+    """有効径の異なる非球面エレメント。"""
+    return LensElement(
+        radius1=50.0,
+        radius2=-60.0,
+        thickness=5.5,
+        specific_gravity=2.6,
+        diameter1=38.0,
+        diameter2=34.0,
+        max_diameter=40.0,
+        coefficients1=AsphericCoefficients(conic=-0.5, a4=1e-6),
+    )
+
+
+@pytest.fixture
+def flat_plate() -> LensElement:
+    """平行平板（円柱）のエレメント。"""
+    return LensElement(
+        radius1=None,
+        radius2=None,
+        thickness=5.0,
+        specific_gravity=2.5,
+        diameter1=40.0,
+        diameter2=40.0,
+        max_diameter=40.0,
+    )
+
+
+def test_mass_matches_calculate_glass_weight(aspheric_element: LensElement) -> None:
+    """質量が `calculate_glass_weight()` の結果と一致することを検証する。"""
+    properties = calculate_mass_properties(aspheric_element)
+    expected = calculate_glass_weight(
+        radius1=aspheric_element.radius1,
+        radius2=aspheric_element.radius2,
+        thickness=aspheric_element.thickness,
+        specific_gravity=aspheric_element.specific_gravity,
+        diameter1=aspheric_element.diameter1,
+        diameter2=aspheric_element.diameter2,
+        max_diameter=aspheric_element.max_diameter,
+        coefficients1=aspheric_element.coefficients1,
+    )
+    assert properties is not None
+    assert properties.mass == pytest.approx(expected, rel=1e-12)
+
+
+def test_flat_plate_matches_cylinder_formulas(flat_plate: LensElement) -> None:
+    """平行平板の重心・慣性モーメントが円柱の解析解と一致することを検証する。"""
+    properties = calculate_mass_properties(flat_plate)
+    assert properties is not None
+
+    radius = 20.0
+    thickness = 5.0
+    mass = 2.5 * math.pi * radius**2 * thickness / 1000.0
+    assert properties.mass == pytest.approx(mass, rel=1e-12)
+    assert properties.center_of_gravity == pytest.approx(thickness / 2.0)
+    assert properties.axial_inertia == pytest.approx(mass * radius**2 / 2.0)
+    assert properties.transverse_inertia == pytest.approx(
+        mass * (3.0 * radius**2 + thickness**2) / 12.0
+    )
+
+
+def test_ball_lens_approximates_sphere() -> None:
+    """両凸の球レンズが球の解析解に近い値となることを検証する。"""
+    ball = LensElement(
+        radius1=10.0,
+        radius2=-10.0,
+        thickness=20.0,
+        specific_gravity=1.0,
+        diameter1=19.9999,
+        diameter2=19.9999,
+        max_diameter=20.0,
+    )
+    properties = calculate_mass_properties(ball)
+    assert properties is not None
+
+    mass = 4.0 / 3.0 * math.pi * 10.0**3 / 1000.0
+    assert properties.mass == pytest.approx(mass, rel=1e-3)
+    assert properties.center_of_gravity == pytest.approx(10.0)
+    assert properties.axial_inertia == pytest.approx(0.4 * mass * 100.0, rel=2e-3)
+    assert properties.transverse_inertia == pytest.approx(0.4 * mass * 100.0, rel=1e-3)
+
+
+def test_batch_matches_individual_calls(
+    aspheric_element: LensElement, flat_plate: LensElement
+) -> None:
+    """一括計算の結果が個別計算と一致することを検証する。"""
+    batch = calculate_mass_properties_batch([aspheric_element, flat_plate])
+    assert batch == [
+        calculate_mass_properties(aspheric_element),
+        calculate_mass_properties(flat_plate),
+    ]
+
+
+def test_batch_returns_none_for_invalid_sag(flat_plate: LensElement) -> None:
+    """サグ計算に失敗したエレメントのみNoneとなることを検証する（異常系）。"""
+    invalid = LensElement(
+        radius1=5.0,
+        radius2=None,
+        thickness=3.0,
+        specific_gravity=2.5,
+        diameter1=25.0,
+        diameter2=20.0,
+        max_diameter=25.0,
+        coefficients1=AsphericCoefficients(conic=10.0),
+    )
+    results = calculate_mass_properties_batch([flat_plate, invalid])
+    assert results[0] is not None
+    assert results[1] is None
+    assert calculate_assembly_mass_properties([flat_plate, invalid], [1.0]) is None
+
+
+def test_batch_empty() -> None:
+    """空の入力では空リストを返すことを検証する。"""
+    assert calculate_mass_properties_batch([]) == []
+
+
+def test_assembly_of_plates_uses_parallel_axis_theorem(flat_plate: LensElement) -> None:
+    """間隔を空けた2枚の平行平板で、合成重心と平行軸の定理を検証する。"""
+    single = calculate_mass_properties(flat_plate)
+    assembly = calculate_assembly_mass_properties([flat_plate, flat_plate], [10.0])
+    assert single is not None
+    assert assembly is not None
+
+    # 2枚目の重心位置 = 5 + 10 + 2.5 = 17.5, 合成重心 = 10.0
+    assert assembly.mass == pytest.approx(2.0 * single.mass)
+    assert assembly.center_of_gravity == pytest.approx(10.0)
+    assert assembly.axial_inertia == pytest.approx(2.0 * single.axial_inertia)
+    assert assembly.transverse_inertia == pytest.approx(
+        2.0 * (single.transverse_inertia + single.mass * 7.5**2)
+    )
+
+
+def test_cemented_plates_equal_single_plate(flat_plate: LensElement) -> None:
+    """間隔0で接合した2枚の平行平板が厚み2倍の平板と一致することを検証する。"""
+    thick = LensElement(
+        radius1=None,
+        radius2=None,
+        thickness=10.0,
+        specific_gravity=2.5,
+        diameter1=40.0,
+        diameter2=40.0,
+        max_diameter=40.0,
+    )
+    assembly = calculate_assembly_mass_properties([flat_plate, flat_plate], [0.0])
+    expected = calculate_mass_properties(thick)
+    assert assembly is not None
+    assert expected is not None
+    assert assembly.mass == pytest.approx(expected.mass)
+    assert assembly.center_of_gravity == pytest.approx(expected.center_of_gravity)
+    assert assembly.transverse_inertia == pytest.approx(expected.transverse_inertia)
+
+
+def test_assembly_requires_matching_air_gaps(flat_plate: LensElement) -> None:
+    """air_gapsの要素数が不正な場合にValueErrorを送出することを検証する。"""
+    with pytest.raises(ValueError):
+        calculate_assembly_mass_properties([flat_plate, flat_plate], [])
+
+
+def test_combine_mass_properties_requires_matching_positions() -> None:
+    """positionsの要素数が不正な場合にValueErrorを送出することを検証する。"""
+    properties = MassProperties(1.0, 0.0, 1.0, 1.0)
+    with pytest.raises(ValueError):
+        combine_mass_properties([properties], [])
+
+
+def test_lens_element_validates_numbers() -> None:
+    """LensElementが数値以外の厚みを拒否することを検証する。"""
+    with pytest.raises(TypeError, match="thicknessは数値である必要があります"):
+        LensElement(None, None, "5", 2.5, 40.0, 40.0, 40.0)  # type: ignore
@@ -0,0 +1,169 @@
+import math
+
+import pytest
+
+from src.optics.calculations import AsphericCoefficients, calculate_sag
+from src.optics.revision import (
+    STATUS_ADDED,
+    STATUS_CHANGED,
+    STATUS_REMOVED,
+    STATUS_UNCHANGED,
+    STATUS_UNDEFINED,
+    compare_designs,
+    compare_surfaces,
+)
+from src.optics.seq_file import SeqDesign, SeqSurface
+
+
+def _surface(
+    name: str,
+    radius: float | None,
+    diameter: float | None = 20.0,
+    coefficients: AsphericCoefficients | None = None,
+    thickness: float | None = 5.0,
+) -> SeqSurface:
+    """テスト用の面データを作成する。"""
+    return SeqSurface(name, radius, thickness, "BK7", diameter, coefficients)
+
+
+def test_compare_identical_surfaces_short_circuits() -> None:
+    """形状が同一の面はサグを評価せずunchangedとなることを検証する。"""
+    coefficients = AsphericCoefficients(conic=-1.0, a4=1e-5)
+    old = [_surface("S1", 50.0, coefficients=coefficients)]
+    new = [_surface("S1", 50.0, coefficients=AsphericCoefficients(-1.0, 1e-5))]
+    diffs = compare_surfaces(old, new)
+    assert diffs[0].status == STATUS_UNCHANGED
+    assert diffs[0].max_deviation == 0.0
+    assert not diffs[0].needs_update
+
+
+def test_compare_radius_change_matches_calculate_sag() -> None:
+    """曲率半径の変更によるサグ差の最大値が有効径端で一致することを検証する。"""
+    diffs = compare_surfaces([_surface("S1", 50.0)], [_surface("S1", 48.0)])
+    expected = abs(calculate_sag(48.0, 20.0) - calculate_sag(50.0, 20.0))
+    assert diffs[0].status == STATUS_CHANGED
+    assert diffs[0].max_deviation == pytest.approx(expected, rel=1e-12)
+    assert diffs[0].max_deviation_height == pytest.approx(10.0)
+    assert 0.0 < diffs[0].rms_deviation < diffs[0].max_deviation
+
+
+def test_compare_uses_larger_effective_diameter() -> None:
+    """新旧で有効径が異なる場合は大きい方で評価することを検証する。"""
+    diffs = compare_surfaces(
+        [_surface("S1", 50.0, diameter=10.0)], [_surface("S1", 48.0, diameter=20.0)]
+    )
+    assert diffs[0].max_deviation_height == pytest.approx(10.0)
+
+
+def test_compare_small_change_below_tolerance_is_unchanged() -> None:
+    """閾値以下の形状差はunchangedとなることを検証する。"""
+    old = [_surface("S1", 50.0, coefficients=AsphericCoefficients(a14=0.0))]
+    new = [_surface("S1", 50.0, coefficients=AsphericCoefficients(a14=1e-22))]
+    diffs = compare_surfaces(old, new, tolerance=1e-6)
+    assert diffs[0].status == STATUS_UNCHANGED
+    assert diffs[0].max_deviation == pytest.approx(1e-22 * 10.0**14)
+
+
+def test_compare_reports_spacing_change() -> None:
+    """形状が同じでも面間隔の変更で再生成が必要となることを検証する。"""
+    old = [_surface("S1", 50.0), _surface("S2", -50.0)]
+    new = [_surface("S1", 50.0, thickness=6.0), _surface("S2", -50.0)]
+    diffs = compare_surfaces(old, new)
+    assert [d.status for d in diffs] == [STATUS_UNCHANGED, STATUS_UNCHANGED]
+    assert diffs[0].spacing_changed
+    assert [d.needs_update for d in diffs] == [True, False]
+
+
+def test_compare_reports_diameter_change() -> None:
+    """形状が同じでも有効径の変更で再生成が必要となることを検証する。"""
+    diffs = compare_surfaces(
+        [_surface("S1", 50.0, diameter=20.0)], [_surface("S1", 50.0, diameter=24.0)]
+    )
+    assert diffs[0].status == STATUS_UNCHANGED
+    assert diffs[0].diameter_changed
+    assert diffs[0].needs_update
+
+
+def test_compare_aligns_inserted_surface() -> None:
+    """面の挿入で面番号がずれても以降の面を正しく対応付けることを検証する。"""
+    old = [_surface("S1", 50.0), _surface("S2", -50.0), _surface("S3", 30.0)]
+    new = [
+        _surface("S1", 50.0),
+        _surface("S2", 80.0, thickness=2.0),
+        _surface("S3", -50.0),
+        _surface("S4", 30.0),
+    ]
+    diffs = compare_surfaces(old, new)
+    assert [(d.name, d.old_name, d.status) for d in diffs] == [
+        ("S1", "S1", STATUS_UNCHANGED),
+        ("S2", None, STATUS_ADDED),
+        ("S3", "S2", STATUS_UNCHANGED),
+        ("S4", "S3", STATUS_UNCHANGED),
+    ]
+
+
+def test_compare_aligns_removed_surface() -> None:
+    """面の削除と以降の面の形状変化を、曲率の近い面同士で対応付けることを検証する。"""
+    old = [_surface("S1", 50.0), _surface("S2", 80.0), _surface("S3", -50.0)]
+    new = [_surface("S1", 50.0), _surface("S2", -45.0)]
+    diffs = compare_surfaces(old, new)
+    assert [(d.name, d.old_name, d.status) for d in diffs] == [
+        ("S1", "S1", STATUS_UNCHANGED),
+        ("S2", "S3", STATUS_CHANGED),
+        (None, "S2", STATUS_REMOVED),
+    ]
+
+
+def test_compare_lists_renamed_and_removed_surfaces() -> None:
+    """面の削除で面名が繰り上がった面を再生成対象とし、削除面を別に列挙することを検証する。"""
+    radii = [None, 50.0, -40.0, 30.0, None]
+    old = [_surface(f"S{i}", r) for i, r in enumerate(radii)]
+    new = [_surface(f"S{i}", r) for i, r in enumerate(radii[:2] + radii[3:])]
+    diff = compare_designs(SeqDesign("REV-A", old), SeqDesign("REV-B", new))
+    assert [(d.name, d.old_name) for d in diff.surfaces if d.renamed] == [
+        ("S2", "S3"),
+        ("S3", "S4"),
+    ]
+    assert all(d.status != STATUS_CHANGED for d in diff.surfaces)
+    assert diff.changed_surfaces == ["S2", "S3"]
+    assert diff.removed_surfaces == ["S2"]
+
+
+def test_compare_aligns_inserted_and_modified_surface() -> None:
+    """面の挿入と隣接面の変更が重なっても、曲率の近い面同士を対応付けることを検証する。"""
+    old = [_surface("S1", 50.0), _surface("S2", -30.0)]
+    new = [
+        _surface("S1", 100.0, thickness=2.0, coefficients=AsphericCoefficients(5.0)),
+        _surface("S2", 51.0),
+        _surface("S3", -30.0),
+    ]
+    diffs = compare_surfaces(old, new)
+    assert [(d.name, d.old_name, d.status) for d in diffs] == [
+        ("S1", None, STATUS_ADDED),
+        ("S2", "S1", STATUS_CHANGED),
+        ("S3", "S2", STATUS_UNCHANGED),
+    ]
+
+
+def test_compare_marks_undefined_surfaces() -> None:
+    """有効径が不明、またはサグ計算不可の面がundefinedとなることを検証する。"""
+    old = [_surface("S1", 50.0, diameter=None), _surface("S2", 5.0)]
+    new = [_surface("S1", 40.0, diameter=None), _surface("S2", 6.0)]
+    diffs = compare_surfaces(old, new)
+    assert [d.status for d in diffs] == [STATUS_UNDEFINED, STATUS_UNDEFINED]
+    assert math.isnan(diffs[1].max_deviation)
+
+
+def test_compare_designs_lists_changed_surfaces() -> None:
+    """設計同士の比較で再生成が必要な面名を列挙することを検証する。"""
+    old = SeqDesign("REV-A", [_surface("S1", 50.0), _surface("S2", -50.0)])
+    new = SeqDesign("REV-B", [_surface("S1", 50.0), _surface("S2", -45.0)])
+    diff = compare_designs(old, new)
+    assert (diff.old_title, diff.new_title) == ("REV-A", "REV-B")
+    assert diff.changed_surfaces == ["S2"]
+
+
+def test_compare_rejects_invalid_steps() -> None:
+    """stepsが1未満の場合にValueErrorとなることを検証する。"""
+    with pytest.raises(ValueError, match="steps"):
+        compare_surfaces([], [], steps=0)
@@ -0,0 +1,139 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.optics.calculations import AsphericCoefficients, calculate_sag
+from src.optics.profiles import calculate_sag_derivatives
+from src.optics.screening import (
+    VIOLATION_CURVATURE,
+    VIOLATION_INFLECTION,
+    VIOLATION_SAG_UNDEFINED,
+    VIOLATION_SLOPE,
+    ScreeningLimits,
+    ScreeningSurface,
+    build_screening_report,
+    screen_surfaces,
+)
+
+# 中心付近で凸、周辺で凹に反転する非球面
+INFLECTED = AsphericCoefficients(a4=-1e-4)
+
+
+def test_derivatives_match_finite_difference() -> None:
+    """解析微分が `calculate_sag()` の数値微分と一致することを検証する。"""
+    coefficients = AsphericCoefficients(
+        conic=-0.8, a4=2.5e-6, a6=-1.2e-9, a8=5.3e-13, a10=-8.7e-17
+    )
+    h = 7.0
+    step = 1e-4
+    first, second = calculate_sag_derivatives([50.0], np.array([h]), [coefficients])
+
+    def sag(height: float) -> float:
+        value = calculate_sag(50.0, 2.0 * height, coefficients)
+        assert value is not None
+        return value
+
+    expected_first = (sag(h + step) - sag(h - step)) / (2.0 * step)
+    expected_second = (sag(h + step) - 2.0 * sag(h) + sag(h - step)) / step**2
+    assert first[0, 0] == pytest.approx(expected_first, rel=1e-7)
+    assert second[0, 0] == pytest.approx(expected_second, rel=1e-4)
+
+
+def test_sphere_slope_and_curvature() -> None:
+    """球面の最大面傾斜角と局所曲率が解析解と一致することを検証する。"""
+    (result,) = screen_surfaces([ScreeningSurface("D1", "S1", 50.0, 40.0)])
+    assert result.max_slope_angle == pytest.approx(math.degrees(math.asin(0.4)))
+    assert result.max_slope_height == pytest.approx(20.0)
+    assert result.min_curvature == pytest.approx(0.02)
+    assert result.max_curvature == pytest.approx(0.02)
+    assert result.inflection_heights == []
+    assert result.violations == []
+
+
+def test_plane_has_no_inflection() -> None:
+    """平面では傾斜角・曲率が0で変曲点がないことを検証する。"""
+    (result,) = screen_surfaces([ScreeningSurface("D1", "S1", None, 20.0)])
+    assert result.max_slope_angle == 0.0
+    assert result.max_curvature == 0.0
+    assert result.inflection_heights == []
+
+
+def test_inflection_point_is_detected() -> None:
+    """非球面の変曲点が検出され、違反として判定されることを検証する。"""
+    (result,) = screen_surfaces([ScreeningSurface("D1", "S1", 50.0, 20.0, INFLECTED)])
+    # z'' = c/arg^(3/2) + 12·A4·h² = 0 となる高さ（arg≒1）
+    assert len(result.inflection_heights) == 1
+    assert result.inflection_heights[0] == pytest.approx(
+        math.sqrt(0.02 / 12e-4), rel=1e-2
+    )
+    assert VIOLATION_INFLECTION in result.violations
+
+
+def test_limits_flag_violations() -> None:
+    """面傾斜角・曲率の判定基準を超えた場合に違反となることを検証する。"""
+    limits = ScreeningLimits(
+        max_slope_angle=20.0, max_curvature=0.01, max_inflection_points=1
+    )
+    sphere, inflected = screen_surfaces(
+        [
+            ScreeningSurface("D1", "S1", 50.0, 40.0),
+            ScreeningSurface("D1", "S2", 50.0, 20.0, INFLECTED),
+        ],
+        limits,
+    )
+    assert sphere.violations == [VIOLATION_SLOPE, VIOLATION_CURVATURE]
+    assert VIOLATION_INFLECTION not in inflected.violations
+
+
+def test_undefined_sag_is_violation() -> None:
+    """有効径内でサグ計算不可となる面が違反となることを検証する（異常系）。"""
+    (result,) = screen_surfaces([ScreeningSurface("D1", "S1", 10.0, 100.0)])
+    assert VIOLATION_SAG_UNDEFINED in result.violations
+
+
+@pytest.mark.parametrize("diameter", [25.0, 10.0])
+def test_undefined_sag_does_not_create_inflection(diameter: float) -> None:
+    """サグ計算不可の点が変曲点として数えられないことを検証する（異常系）。"""
+    (result,) = screen_surfaces(
+        [ScreeningSurface("D1", "S1", 5.0, diameter)], steps=100
+    )
+    assert result.inflection_heights == []
+    assert result.violations == [VIOLATION_SAG_UNDEFINED, VIOLATION_SLOPE]
+
+
+def test_chunking_does_not_change_results() -> None:
+    """チャンク分割の有無で結果が変わらないことを検証する。"""
+    surfaces = [
+        ScreeningSurface(
+            f"D{i}", "S1", 20.0 + i, 20.0, AsphericCoefficients(a4=1e-6 * i)
+        )
+        for i in range(10)
+    ]
+    whole = screen_surfaces(surfaces, steps=200)
+    chunked = screen_surfaces(iter(surfaces), steps=200, chunk_size=3)
+    assert whole == chunked
+
+
+def test_report_is_ranked_by_severity() -> None:
+    """レポートが違反数・面傾斜角の順に並ぶことを検証する。"""
+    results = screen_surfaces(
+        [
+            ScreeningSurface("D1", "S1", 100.0, 20.0),
+            ScreeningSurface("D2", "S1", 50.0, 20.0, INFLECTED),
+            ScreeningSurface("D3", "S1", 30.0, 40.0),
+        ],
+        ScreeningLimits(max_slope_angle=30.0),
+    )
+    report = build_screening_report(results)
+    assert list(report["rank"]) == [1, 2, 3]
+    assert list(report["design"]) == ["D3", "D2", "D1"]
+
+    violations = build_screening_report(results, violations_only=True)
+    assert list(violations["design"]) == ["D3", "D2"]
+
+
+def test_screen_surfaces_rejects_invalid_steps() -> None:
+    """分割数が不正な場合にValueErrorを送出することを検証する。"""
+    with pytest.raises(ValueError):
+        screen_surfaces([], steps=0)
@@ -0,0 +1,64 @@
+import pytest
+
+from src.optics.calculations import AsphericCoefficients
+from src.optics.seq_file import parse_seq, read_seq
+
+SEQ_TEXT = """RDM;LEN "VER: 11.5"
+TITLE 'TEST-LENS'
+SO  0.000000000000E+00 0.100000000000E+21
+S   50.0 5.0 SBSL7_OHARA
+  CIR 10.0
+  ASP
+  K -0.5
+  A 0.100000000000E-05; B -0.200000000000E-08; C 0.0; &
+    D 0.0
+  E 0.300000000000E-15; F 0.0
+S   -50.0 10.0
+  STO
+  CIR 9.5
+S   0.0 2.0 'GLASS1'
+SI  0.0 0.0
+GO
+"""
+
+
+def test_parse_seq_surfaces() -> None:
+    """面データ・絞り・有効径・硝材名が読み取れることを検証する。"""
+    design = parse_seq(SEQ_TEXT)
+    assert design.title == "TEST-LENS"
+    assert [s.name for s in design.surfaces] == ["S0", "S1", "S2", "S3", "S4"]
+
+    obj, s1, s2, s3, image = design.surfaces
+    assert obj.radius is None
+    assert obj.thickness is None
+    assert s1.radius == 50.0
+    assert s1.thickness == 5.0
+    assert s1.glass == "SBSL7"
+    assert s1.diameter == pytest.approx(20.0)
+    assert s2.glass is None
+    assert s2.is_stop
+    assert s3.radius is None
+    assert s3.glass == "GLASS1"
+    assert image.diameter is None
+
+
+def test_parse_seq_aspheric_coefficients() -> None:
+    """非球面係数（継続行を含む）が読み取れることを検証する。"""
+    design = parse_seq(SEQ_TEXT)
+    assert design.surfaces[1].coefficients == AsphericCoefficients(
+        conic=-0.5, a4=1e-6, a6=-2e-9, a12=3e-16
+    )
+    assert design.surfaces[2].coefficients is None
+
+
+def test_parse_seq_rejects_broken_surface() -> None:
+    """数値を解釈できない面データでValueErrorを送出することを検証する（異常系）。"""
+    with pytest.raises(ValueError):
+        parse_seq("S 50.0 abc\n")
+
+
+def test_read_seq_uses_file_name_without_title(tmp_path) -> None:
+    """TITLE行がない場合はファイル名を設計名とすることを検証する。"""
+    path = tmp_path / "design01.seq"
+    path.write_text("S 50.0 5.0\n", encoding="cp932")
+    assert read_seq(path).title == "design01"
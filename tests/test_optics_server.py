@@ -0,0 +1,216 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.optics.calculations import (
+    AsphericCoefficients,
+    calculate_glass_weight,
+    calculate_sag,
+)
+from src.optics.server import VALUE_ERROR, CalculationService, start_server
+
+
+@pytest.fixture
+def service() -> CalculationService:
+    """計算サービスのインスタンス。"""
+    return CalculationService()
+
+
+def _post(port: int, payload: object) -> tuple[int, object]:
+    """ローカルサーバーに一括計算要求を送信し、ステータスと本文を返す。"""
+
+    async def request() -> tuple[int, object]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            b"POST /calculate HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+            + body
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, data = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(data)
+
+    return request()
+
+
+def _run_with_server(payload: object) -> tuple[int, object]:
+    async def scenario() -> tuple[int, object]:
+        server = await start_server(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await _post(port, payload)
+
+    return asyncio.run(scenario())
+
+
+def test_evaluate_sag_matches_calculate_sag(service: CalculationService) -> None:
+    """サグ量の計算結果が `calculate_sag()` と一致することを検証する。"""
+    result = service.evaluate(
+        {
+            "function": "sag",
+            "args": {"radius": 50.0, "diameter": 20.0, "coefficients": {"a4": 1e-6}},
+        }
+    )
+    assert result == calculate_sag(50.0, 20.0, AsphericCoefficients(a4=1e-6))
+
+
+def test_evaluate_keeps_vba_conventions(service: CalculationService) -> None:
+    """計算不可はNone、無限大は"Inf"、不正入力は"#VALUE!"となることを検証する。"""
+    results = service.evaluate_batch(
+        {
+            "requests": [
+                {"function": "sag", "args": {"radius": 10.0, "diameter": 100.0}},
+                {
+                    "function": "focal_length",
+                    "args": {"thickness": 3.0, "refractive_index": 1.5},
+                },
+                {"function": "sag", "args": {"radius": "x", "diameter": 20.0}},
+                {"function": "unknown", "args": {}},
+                "invalid",
+            ]
+        }
+    )["results"]
+    assert results == [None, "Inf", VALUE_ERROR, VALUE_ERROR, VALUE_ERROR]
+
+
+def test_evaluate_glass_weight(service: CalculationService) -> None:
+    """重量の計算結果が `calculate_glass_weight()` と一致することを検証する。"""
+    args = {
+        "radius1": 50.0,
+        "radius2": -50.0,
+        "thickness": 5.0,
+        "specific_gravity": 2.5,
+        "diameter1": 40.0,
+        "diameter2": 40.0,
+        "max_diameter": 40.0,
+        "coefficients1": {"conic": -0.5, "a4": 1e-6},
+    }
+    result = service.evaluate({"function": "glass_weight", "args": args})
+    expected = calculate_glass_weight(
+        50.0, -50.0, 5.0, 2.5, 40.0, 40.0, 40.0, AsphericCoefficients(-0.5, 1e-6)
+    )
+    assert result == pytest.approx(expected)
+
+
+def test_unknown_coefficient_is_value_error(service: CalculationService) -> None:
+    """未知の非球面係数名は"#VALUE!"となることを検証する（異常系）。"""
+    result = service.evaluate(
+        {"function": "sag", "args": {"diameter": 20.0, "coefficients": {"a3": 1.0}}}
+    )
+    assert result == VALUE_ERROR
+
+
+def test_evaluate_batch_rejects_invalid_payload(service: CalculationService) -> None:
+    """requests配列を持たない本文でTypeErrorを送出することを検証する。"""
+    with pytest.raises(TypeError):
+        service.evaluate_batch({"cells": []})
+
+
+def test_boolean_argument_is_value_error_regardless_of_cache(
+    service: CalculationService,
+) -> None:
+    """真偽値の引数は直前に同値の数値を計算していても"#VALUE!"となることを検証する。"""
+    results = service.evaluate_batch(
+        {
+            "requests": [
+                {"function": "sag", "args": {"radius": 1, "diameter": 1}},
+                {"function": "sag", "args": {"radius": True, "diameter": 1}},
+                {
+                    "function": "sag",
+                    "args": {"radius": 50, "diameter": 20, "coefficients": {"a4": 1}},
+                },
+                {
+                    "function": "sag",
+                    "args": {
+                        "radius": 50,
+                        "diameter": 20,
+                        "coefficients": {"a4": True},
+                    },
+                },
+            ]
+        }
+    )["results"]
+    assert results[0] == calculate_sag(1, 1)
+    assert results[1] == VALUE_ERROR
+    assert results[3] == VALUE_ERROR
+
+
+def test_evaluate_overflow_is_value_error(service: CalculationService) -> None:
+    """数値のオーバーフローは"#VALUE!"となり、他のセルに影響しないことを検証する。"""
+    results = service.evaluate_batch(
+        {
+            "requests": [
+                {"function": "sag", "args": {"diameter": 1e30}},
+                {"function": "sag", "args": {"radius": 50.0, "diameter": 20.0}},
+            ]
+        }
+    )["results"]
+    assert results == [VALUE_ERROR, calculate_sag(50.0, 20.0)]
+
+
+def test_evaluate_maps_non_finite_results() -> None:
+    """NaNはNone、無限大は"Inf"に変換されることを検証する。"""
+    service = CalculationService(
+        functions={
+            "nan": lambda args: float("nan"),
+            "inf": lambda args: float("-inf"),
+        }
+    )
+    results = service.evaluate_batch(
+        {"requests": [{"function": "nan"}, {"function": "inf"}]}
+    )["results"]
+    assert results == [None, "Inf"]
+
+
+def test_server_returns_value_error_for_overflow() -> None:
+    """オーバーフローするセルを含む要求でも全セルの結果が返ることを検証する。"""
+    cells = [
+        {"function": "sag", "args": {"diameter": 1e30}},
+        {"function": "sag", "args": {"radius": 50.0, "diameter": 20.0}},
+    ]
+    status, body = _run_with_server({"requests": cells})
+    assert status == 200
+    assert body == {"results": [VALUE_ERROR, calculate_sag(50.0, 20.0)]}
+
+
+def test_server_handles_batched_workbook_recalc() -> None:
+    """1,000セルの一括要求がローカルサーバー経由で処理されることを検証する。"""
+    cells = [
+        {"function": "sag", "args": {"radius": 50.0 + i % 50, "diameter": 20.0}}
+        for i in range(1000)
+    ]
+    status, body = _run_with_server({"requests": cells})
+
+    assert status == 200
+    assert isinstance(body, dict)
+    assert len(body["results"]) == 1000
+    assert body["results"][0] == pytest.approx(calculate_sag(50.0, 20.0))
+
+
+@pytest.mark.benchmark
+def test_server_benchmark_batched_workbook_recalc() -> None:
+    """1,000セルの一括要求がローカルサーバー経由で1秒未満で処理されることを検証する。"""
+    cells = [
+        {"function": "sag", "args": {"radius": 50.0 + i % 50, "diameter": 20.0}}
+        for i in range(1000)
+    ]
+    start = time.perf_counter()
+    status, body = _run_with_server({"requests": cells})
+    elapsed = time.perf_counter() - start
+
+    assert status == 200
+    assert isinstance(body, dict)
+    assert len(body["results"]) == 1000
+    assert elapsed < 1.0
+
+
+def test_server_returns_bad_request_for_invalid_json() -> None:
+    """不正な本文に対して400を返すことを検証する。"""
+    status, body = _run_with_server({"cells": []})
+    assert status == 400
+    assert "error" in body  # type: ignore[operator]
@@ -0,0 +1,216 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.optics.seq_file import parse_seq
+from src.pipeline import watch
+from src.pipeline.watch import (
+    STAGE_CALCULATE,
+    STAGE_EXPORT,
+    STAGE_PARSE,
+    WatchPipeline,
+    WatchState,
+    calculate_design,
+    default_exporter,
+)
+
+SEQ_TEXT = """TITLE 'W1'
+SO 0.0 1e20
+S 50.0 5.0 SBSL7_OHARA
+  CIR 10.0
+S -50.0 10.0
+  CIR 10.0
+SI 0.0 0.0
+"""
+
+
+class RecordingExporter:
+    """出力段の呼び出しを記録するエクスポーター。"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, relative_path: str, tables: dict[str, Any]) -> list[Path]:
+        self.calls.append(relative_path)
+        return []
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """設計ファイルを2つ置いた監視ディレクトリ。"""
+    root = tmp_path / "designs"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.seq").write_text(SEQ_TEXT, encoding="cp932")
+    (root / "sub" / "b.SEQ").write_text(SEQ_TEXT, encoding="cp932")
+    (root / "note.txt").write_text("ignored", encoding="utf-8")
+    return root
+
+
+def _pipeline(
+    source: Path, state_path: Path, exporter: RecordingExporter
+) -> WatchPipeline:
+    return WatchPipeline(
+        source_dir=source,
+        state=WatchState.load(state_path),
+        exporter=exporter,
+        concurrency=2,
+        queue_size=1,
+    )
+
+
+def test_only_new_or_changed_files_are_processed(source: Path, tmp_path: Path) -> None:
+    """初回は全ファイル、以降は変更ファイルのみ処理されることを検証する。"""
+    state_path = tmp_path / "state.json"
+    exporter = RecordingExporter()
+    pipeline = _pipeline(source, state_path, exporter)
+
+    assert sorted(asyncio.run(pipeline.run_once())) == ["a.seq", "sub/b.SEQ"]
+    assert asyncio.run(pipeline.run_once()) == []
+
+    (source / "a.seq").write_text(SEQ_TEXT + "GO\n", encoding="cp932")
+    assert asyncio.run(pipeline.run_once()) == ["a.seq"]
+    assert sorted(exporter.calls) == ["a.seq", "a.seq", "sub/b.SEQ"]
+
+    metrics = pipeline.metrics
+    assert metrics[STAGE_PARSE].count == 3
+    assert metrics[STAGE_CALCULATE].count == 3
+    assert metrics[STAGE_EXPORT].count == 3
+
+
+def test_touch_without_content_change_is_skipped(source: Path, tmp_path: Path) -> None:
+    """更新時刻のみ変わったファイルは再処理されないことを検証する。"""
+    exporter = RecordingExporter()
+    pipeline = _pipeline(source, tmp_path / "state.json", exporter)
+    asyncio.run(pipeline.run_once())
+
+    stat = (source / "a.seq").stat()
+    os.utime(source / "a.seq", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert asyncio.run(pipeline.run_once()) == []
+
+
+def test_state_survives_restart(source: Path, tmp_path: Path) -> None:
+    """状態ファイルから再開した場合に処理済みファイルを再処理しないことを検証する。"""
+    state_path = tmp_path / "state.json"
+    asyncio.run(_pipeline(source, state_path, RecordingExporter()).run_once())
+
+    exporter = RecordingExporter()
+    restarted = _pipeline(source, state_path, exporter)
+    assert asyncio.run(restarted.run_once()) == []
+    assert exporter.calls == []
+
+
+def test_failed_file_is_retried(source: Path, tmp_path: Path) -> None:
+    """処理に失敗したファイルは状態に記録されず、次回再試行されることを検証する。"""
+    (source / "broken.seq").write_text("S 50.0 abc\n", encoding="cp932")
+    pipeline = _pipeline(source, tmp_path / "state.json", RecordingExporter())
+
+    assert "broken.seq" not in asyncio.run(pipeline.run_once())
+    assert "broken.seq" not in pipeline.state.files
+
+    (source / "broken.seq").write_text(SEQ_TEXT, encoding="cp932")
+    assert asyncio.run(pipeline.run_once()) == ["broken.seq"]
+
+
+def test_deleted_file_is_pruned_from_state(source: Path, tmp_path: Path) -> None:
+    """削除された設計ファイルの記録が状態ファイルから除かれることを検証する。"""
+    state_path = tmp_path / "state.json"
+    asyncio.run(_pipeline(source, state_path, RecordingExporter()).run_once())
+
+    (source / "a.seq").unlink()
+    pipeline = _pipeline(source, state_path, RecordingExporter())
+    assert asyncio.run(pipeline.run_once()) == []
+    assert set(WatchState.load(state_path).files) == {"sub/b.SEQ"}
+
+
+def test_scan_is_throttled_by_queue(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """キューが満杯の間は走査（指紋の計算）が先行しないことを検証する。"""
+    root = tmp_path / "designs"
+    root.mkdir()
+    for i in range(8):
+        (root / f"d{i}.seq").write_text(SEQ_TEXT, encoding="cp932")
+
+    events: list[str] = []
+    original_hash = watch.hash_file
+
+    def recording_hash(path: Path) -> str:
+        events.append("hash")
+        return original_hash(path)
+
+    def recording_parser(path: Path) -> Any:
+        events.append("parse")
+        return parse_seq(path.read_text(encoding="cp932"))
+
+    monkeypatch.setattr(watch, "hash_file", recording_hash)
+    pipeline = WatchPipeline(
+        source_dir=root,
+        state=WatchState.load(tmp_path / "state.json"),
+        exporter=RecordingExporter(),
+        concurrency=1,
+        queue_size=1,
+        parser=recording_parser,
+    )
+    assert len(asyncio.run(pipeline.run_once())) == 8
+
+    # 最初の解析までに指紋を計算できるのは、処理中・キュー内・投入待ちの3件まで
+    assert events.index("parse") <= 3
+
+
+def test_state_is_saved_in_batches(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """状態ファイルが処理ごとではなく save_interval 件ごとに書き出されることを検証する。"""
+    for i in range(4):
+        (source / f"extra{i}.seq").write_text(SEQ_TEXT, encoding="cp932")
+    writes: list[str] = []
+    original_write = WatchState.write
+
+    def recording_write(self: WatchState, text: str) -> None:
+        writes.append(text)
+        original_write(self, text)
+
+    monkeypatch.setattr(WatchState, "write", recording_write)
+    state_path = tmp_path / "state.json"
+    pipeline = WatchPipeline(
+        source_dir=source,
+        state=WatchState.load(state_path),
+        exporter=RecordingExporter(),
+        concurrency=1,
+        save_interval=4,
+    )
+    assert len(asyncio.run(pipeline.run_once())) == 6
+    assert len(writes) == 2
+    assert len(WatchState.load(state_path).files) == 6
+
+    # 変更がなければ状態ファイルを書き出さない
+    asyncio.run(pipeline.run_once())
+    assert len(writes) == 2
+
+
+def test_corrupted_state_file_is_reset(tmp_path: Path) -> None:
+    """壊れた状態ファイルは空の状態として読み込まれることを検証する。"""
+    state_path = tmp_path / "state.json"
+    state_path.write_text("{not json", encoding="utf-8")
+    assert WatchState.load(state_path).files == {}
+
+
+def test_calculate_design_builds_tables() -> None:
+    """設計データからサグテーブルと面データ一覧が作成されることを検証する。"""
+    tables = calculate_design(parse_seq(SEQ_TEXT))
+    assert set(tables["sag"]["surface"]) == {"S1", "S2"}
+    assert list(tables["surfaces"]["surface"]) == ["S0", "S1", "S2", "S3"]
+    assert (tables["sag"]["design"] == "W1").all()
+
+
+def test_default_exporter_requires_pyarrow(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """pyarrowがない場合は監視開始前にImportErrorとなることを検証する（異常系）。"""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="pyarrow"):
+        default_exporter(tmp_path)